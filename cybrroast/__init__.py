@@ -5,14 +5,18 @@ Roast any website's SEO, performance, and design with actual technical scores.
 Think Gordon Ramsay meets web development.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "Cybrflux"
 __email__ = ""
 __license__ = "MIT"
 
-from .auditor import WebsiteAuditor
-from .roaster import Roaster
-from .reporter import TerminalReporter, MarkdownReporter, JsonReporter
+if TYPE_CHECKING:
+    from .auditor import WebsiteAuditor
+    from .roaster import Roaster
+    from .reporter import TerminalReporter, MarkdownReporter, JsonReporter
 
 __all__ = [
     "WebsiteAuditor",
@@ -21,3 +25,23 @@ __all__ = [
     "MarkdownReporter",
     "JsonReporter",
 ]
+
+# Public classes are imported on first access so that `import cybrroast` (and
+# the CLI's --help/--version paths) don't pay for the HTTP and parser stack.
+_LAZY_IMPORTS = {
+    "WebsiteAuditor": ".auditor",
+    "Roaster": ".roaster",
+    "TerminalReporter": ".reporter",
+    "MarkdownReporter": ".reporter",
+    "JsonReporter": ".reporter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily imported public classes."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,76 @@
+"""
+Scalar scoring kernels for site-roast.
+
+These back the arithmetic helpers on ScoreCalculator. They are plain Python
+by default; set CYBRROAST_JIT=1 with Numba installed to compile them to
+native code instead. JIT is opt-in because the first call pays a compile
+step that a one-shot CLI run never earns back.
+"""
+
+import os
+from typing import Any, Callable, TypeVar, Union, cast
+
+F = TypeVar("F", bound=Callable[..., Any])
+N = TypeVar("N", int, float)
+
+# Scores are usually ints but floats are accepted and passed through unchanged
+Number = Union[int, float]
+
+
+def _no_jit(func: F) -> F:
+    """Leave a kernel as plain Python."""
+    return func
+
+
+_jit: Callable[[F], F] = _no_jit
+
+if os.environ.get("CYBRROAST_JIT") == "1":
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; fall back to plain Python
+        pass
+    else:
+        _jit = cast(Callable[[F], F], njit(cache=True))
+
+JIT_ENABLED = _jit is not _no_jit
+
+
+@_jit
+def clip(x: N, lo: N = 0, hi: N = 100) -> N:
+    """Clamp x into [lo, hi]; NaN clamps to hi, as min()/max() chains did."""
+    return hi if not x <= hi else (lo if x < lo else x)
+
+
+@_jit
+def normalize(value: float, min_val: float, max_val: float, target_min: int, target_max: int) -> int:
+    """Map value from [min_val, max_val] onto [target_min, target_max]."""
+    # Identity mapping, the common normalize_score(value, 0, 100) call
+    if min_val == 0 and max_val == 100 and target_min == 0 and target_max == 100:
+        return int(clip(value, 0, 100))
+
+    if max_val == min_val:
+        return target_max
+
+    span = max_val - min_val
+    normalized = clip((value - min_val) / span, 0, 1)
+
+    if 0 < normalized < 1:
+        # Scale before dividing: for integral inputs the quotient is then exact,
+        # so truncation cannot land one below the true score as the rounded
+        # ratio did (29/100 * 100 == 28.999...)
+        score = int((value - min_val) * (target_max - target_min) / span + target_min)
+    else:
+        score = int(normalized * (target_max - target_min) + target_min)
+    return clip(score, target_min, target_max)
+
+
+@_jit
+def penalty(score: Number, penalty_amount: Number, min_score: Number) -> Number:
+    """Subtract a penalty, never going below min_score."""
+    return max(min_score, score - penalty_amount)
+
+
+@_jit
+def bonus(score: Number, bonus_amount: Number, max_score: Number) -> Number:
+    """Add a bonus, never going above max_score."""
+    return min(max_score, score + bonus_amount)
@@ -4,18 +4,168 @@ Core audit engine for site-roast.
 Fetches websites and analyzes them across 10 SEO/performance categories.
 """
 
+import bisect
+import codecs
+import hashlib
+import json
+import os
+import pickle
 import re
 import ssl
+import sys
+import tempfile
 import time
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
 
+from . import __version__
 
-@dataclass
+
+# Inline/embedded CSS widths of 1000px or more break small viewports
+_FIXED_WIDTH_RE = re.compile(rb'width\s*:\s*\d{4,}px', re.IGNORECASE)
+
+# charset= in a Content-Type header or in a <meta> tag near the top of the page
+_CHARSET_RE = re.compile(rb'charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]*?charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# Byte-order marks and the encodings they announce, longest first
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Lower bound of each letter grade above F, ascending, and the matching grades
+_GRADE_THRESHOLDS = (60, 63, 67, 70, 73, 77, 80, 83, 87, 90, 93, 97)
+_GRADES = ("F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+# Substrings that mark a title or meta description as boilerplate
+_GENERIC_TITLE_WORDS = ("home", "untitled", "index", "page", "website")
+_GENERIC_DESC_PHRASES = ("this is a website", "welcome to", "click here", "learn more")
+
+# Security headers checked by the SSL/Security audit, with what each one does
+_SECURITY_HEADERS = {
+    "Strict-Transport-Security": "HSTS - forces HTTPS connections",
+    "Content-Security-Policy": "CSP - prevents XSS attacks",
+    "X-Frame-Options": "Prevents clickjacking",
+    "X-Content-Type-Options": "Prevents MIME sniffing",
+    "Referrer-Policy": "Controls referrer information leakage",
+}
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _host(href: str) -> str:
+    """Return the lowercased network location of an absolute URL, or '' if it has none."""
+    start = href.find("://")
+    if start == -1:
+        return ""
+    start += 3
+    end = len(href)
+    for sep in "/?#":
+        pos = href.find(sep, start, end)
+        if pos != -1:
+            end = pos
+    return href[start:end].lower()
+
+
+def _codec(label: Optional[bytes], from_meta: bool = False) -> Optional[str]:
+    """
+    Return the Python codec for a charset label, or None if it is unknown.
+    
+    A label found by the <meta> prescan was read as ASCII, so like browsers a
+    UTF-16 label there means UTF-8 and x-user-defined means Windows-1252.
+    """
+    if not label:
+        return None
+    if from_meta and label.lower() == b"x-user-defined":
+        return "cp1252"
+    try:
+        name = codecs.lookup(label.decode("ascii")).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+    if from_meta and name in ("utf-16", "utf-16-le", "utf-16-be"):
+        return "utf-8"
+    # Browsers decode pages labelled Latin-1 or ASCII as Windows-1252
+    return "cp1252" if name in ("iso8859-1", "ascii") else name
+
+
+def _decode_html(body: bytes, content_type: str) -> str:
+    """
+    Decode an HTML body the way a browser picks its encoding.
+    
+    A byte-order mark wins, then the charset of the Content-Type header, then
+    a <meta> declaration in the first 1024 bytes. Undeclared pages are read as
+    UTF-8 if they are valid UTF-8 and otherwise as the detected encoding.
+    """
+    for bom, bom_encoding in _BOMS:
+        if body.startswith(bom):
+            return body.decode(bom_encoding, "replace")
+    
+    header = _CHARSET_RE.search(content_type.encode("latin-1", "replace"))
+    meta = _META_CHARSET_RE.search(body, 0, 1024)
+    encoding = _codec(header and header.group(1)) or _codec(meta and meta.group(1), from_meta=True)
+    if encoding is not None:
+        return body.decode(encoding, "replace")
+    
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        detected = chardet.detect(body)["encoding"] if chardet is not None else None
+        return body.decode(_codec(detected and detected.encode("ascii")) or "utf-8", "replace")
+
+
+def _frozen_type(value: Any) -> Any:
+    """Return a JSON-LD @type value with arrays as tuples; objects are not valid types."""
+    if isinstance(value, list):
+        return tuple(map(_frozen_type, value))
+    if isinstance(value, dict):
+        return "Unknown"
+    return value
+
+
+def _type_label(value: Any) -> str:
+    """Format a JSON-LD @type for a finding, joining multiple types with '/'."""
+    if isinstance(value, tuple):
+        return "/".join(map(_type_label, value))
+    return str(value)
+
+
+@lru_cache(maxsize=1024)
+def _jsonld_types(payload: str) -> Tuple[Any, ...]:
+    """
+    Extract the @type of each object in a JSON-LD script body.
+    
+    Memoized on the raw body, since templated sites repeat the same blocks
+    on every page. Only the types are cached, not the parsed document, and
+    array types are frozen into tuples since every audit shares them.
+    """
+    try:
+        data = json.loads(payload) if payload else {}
+    except json.JSONDecodeError:
+        return ()
+    
+    if isinstance(data, dict):
+        return (_frozen_type(data.get("@type", "Unknown")),)
+    elif isinstance(data, list):
+        return tuple(
+            _frozen_type(item.get("@type", "Unknown")) for item in data if isinstance(item, dict)
+        )
+    return ()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AuditResult:
     """Container for a single audit category result."""
     score: int  # 0-100
@@ -42,8 +192,9 @@ class WebsiteAudit:
     open_graph: AuditResult
     schema: AuditResult
     
-    def get_overall_score(self) -> int:
-        """Calculate the overall score across all categories."""
+    @cached_property
+    def overall_score(self) -> int:
+        """Overall score across all categories, computed once per audit."""
         scores = [
             self.title.score,
             self.meta_description.score,
@@ -58,35 +209,18 @@ class WebsiteAudit:
         ]
         return round(sum(scores) / len(scores))
     
+    @cached_property
+    def grade(self) -> str:
+        """Letter grade for the overall score, computed once per audit."""
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, self.overall_score)]
+    
+    def get_overall_score(self) -> int:
+        """Calculate the overall score across all categories."""
+        return self.overall_score
+    
     def get_grade(self) -> str:
         """Convert overall score to letter grade."""
-        score = self.get_overall_score()
-        if score >= 97:
-            return "A+"
-        elif score >= 93:
-            return "A"
-        elif score >= 90:
-            return "A-"
-        elif score >= 87:
-            return "B+"
-        elif score >= 83:
-            return "B"
-        elif score >= 80:
-            return "B-"
-        elif score >= 77:
-            return "C+"
-        elif score >= 73:
-            return "C"
-        elif score >= 70:
-            return "C-"
-        elif score >= 67:
-            return "D+"
-        elif score >= 63:
-            return "D"
-        elif score >= 60:
-            return "D-"
-        else:
-            return "F"
+        return self.grade
 
 
 class WebsiteAuditor:
@@ -106,16 +240,36 @@ class WebsiteAuditor:
     - Schema/Structured Data
     """
 
-    def __init__(self, timeout: int = 30, user_agent: str = "site-roast/1.0"):
+    # Connection pool size and retry policy for the shared HTTP session
+    POOL_SIZE = 32
+    RETRY_STATUSES = (429, 502, 503, 504)
+    
+    # Only the first MAX_CONTENT_BYTES of a page are downloaded and audited
+    MAX_CONTENT_BYTES = 5 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        timeout: int = 30,
+        user_agent: str = "site-roast/1.0",
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl: int = 24 * 60 * 60,
+    ):
         """
         Initialize the auditor.
         
         Args:
             timeout: Request timeout in seconds.
             user_agent: User-Agent string for HTTP requests.
+            cache_dir: Directory for caching audit results on disk. Pages whose
+                content and security headers are unchanged reuse the cached
+                result. Caching is disabled when None.
+            cache_ttl: Maximum age of a cached result in seconds.
         """
         self.timeout = timeout
         self.user_agent = user_agent
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl = cache_ttl
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": user_agent,
@@ -125,6 +279,29 @@ class WebsiteAuditor:
             "DNT": "1",
             "Connection": "keep-alive",
         })
+        
+        # Reuse connections across audits and retry transient server errors.
+        # The final response of an exhausted retry is still returned so that
+        # raise_for_status() reports it as before. Only RETRY_STATUSES are
+        # retried: connect and read errors, timeouts included, are raised as
+        # they are, so a server that never answers costs one timeout, not four.
+        # Retry-After is ignored too: urllib3 does not cap it, and a 429 asking
+        # for an hour would stall a one-shot run far past the timeout.
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                connect=False,
+                read=False,
+                backoff_factor=0.3,
+                status_forcelist=self.RETRY_STATUSES,
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def audit(self, url: str) -> WebsiteAudit:
         """
@@ -138,48 +315,212 @@ class WebsiteAuditor:
         """
         start_time = time.time()
         
-        # Fetch the page
-        response = self.session.get(url, timeout=self.timeout)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
-        html_content = response.text
+        # Fetch the page, streaming so huge bodies can be cut off early
+        response = self.session.get(url, timeout=self.timeout, stream=True)
+        try:
+            response.raise_for_status()
+            
+            # Don't download or parse PDFs, images, etc. as HTML
+            content_type = (
+                response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+            )
+            if content_type and "html" not in content_type:
+                return self._non_html_audit(url, response, start_time, content_type)
+            
+            # Keep the raw bytes for sizing, caching and the byte-level mobile
+            # checks; only the parser gets a decoded copy
+            html_content, truncated = self._read_body(response)
+        finally:
+            response.close()
+        
+        # The audit is deterministic given the URL, security headers and body
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self.cache_dir / f"{self._cache_key(url, response, html_content)}.pkl"
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return replace(
+                    cached,
+                    timestamp=start_time,
+                    duration_ms=int((time.time() - start_time) * 1000),
+                )
+        
+        tree = LexborHTMLParser(_decode_html(html_content, response.headers.get("Content-Type", "")))
         
         duration_ms = int((time.time() - start_time) * 1000)
         
         # Get response size
-        content_length = len(response.content)
+        content_length = len(html_content)
+        
+        image_stats = self._collect_image_stats(tree)
         
         # Perform all audits
-        return WebsiteAudit(
+        result = WebsiteAudit(
             url=url,
             timestamp=start_time,
             duration_ms=duration_ms,
-            title=self._audit_title(soup),
-            meta_description=self._audit_meta_description(soup),
-            headings=self._audit_headings(soup),
-            images=self._audit_images(soup),
-            mobile=self._audit_mobile(soup, response),
+            title=self._audit_title(tree),
+            meta_description=self._audit_meta_description(tree),
+            headings=self._audit_headings(tree),
+            images=self._audit_images(image_stats),
+            mobile=self._audit_mobile(tree, html_content),
             ssl_security=self._audit_ssl_security(url, response),
-            performance=self._audit_performance(response, content_length, html_content),
-            links=self._audit_links(soup, url),
-            open_graph=self._audit_open_graph(soup),
-            schema=self._audit_schema(soup),
+            performance=self._audit_performance(
+                tree, response, content_length, image_stats, truncated=truncated
+            ),
+            links=self._audit_links(tree, url),
+            open_graph=self._audit_open_graph(tree),
+            schema=self._audit_schema(tree),
         )
+        
+        if cache_path is not None:
+            self._store_cached(cache_path, result)
+        
+        return result
+
+    def _cache_key(self, url: str, response: requests.Response, content: bytes) -> str:
+        """Hash everything the audit depends on into a cache file name."""
+        # BLAKE2b is the fastest hash in hashlib for payloads of this size
+        digest = hashlib.blake2b(digest_size=16)
+        # Upgrades may change the scoring rules or the pickled classes, so
+        # results from another version are never reused
+        digest.update(f"{__version__}\0{url}".encode("utf-8"))
+        # The Content-Type charset decides how the body is decoded
+        digest.update(b"\0" + response.headers.get("Content-Type", "").encode("latin-1", "replace"))
+        for header in _SECURITY_HEADERS:
+            digest.update(b"\0" + response.headers.get(header, "").encode("latin-1", "replace"))
+        digest.update(b"\0" + content)
+        return digest.hexdigest()
+
+    def _load_cached(self, path: Path) -> Optional[WebsiteAudit]:
+        """Return the audit cached at path, or None if missing, stale or unreadable."""
+        try:
+            if time.time() - path.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception:  # Unreadable, corrupt, or pickled from incompatible classes
+            return None
+        return cached if isinstance(cached, WebsiteAudit) else None
+
+    def _store_cached(self, path: Path, audit: WebsiteAudit) -> None:
+        """Write an audit to the cache at path; failures only cost the cache entry."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent audits never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(audit, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def _read_body(self, response: requests.Response) -> Tuple[bytes, bool]:
+        """
+        Read the response body, stopping after MAX_CONTENT_BYTES.
+        
+        Returns:
+            The first MAX_CONTENT_BYTES of the body, and whether anything
+            past them was cut off.
+        """
+        chunks = []
+        size = 0
+        
+        for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            # Read past the limit, so a body of exactly MAX_CONTENT_BYTES
+            # is not mistaken for a truncated one
+            if size > self.MAX_CONTENT_BYTES:
+                break
+        
+        return b"".join(chunks)[:self.MAX_CONTENT_BYTES], size > self.MAX_CONTENT_BYTES
+
+    def _non_html_audit(
+        self,
+        url: str,
+        response: requests.Response,
+        start_time: float,
+        content_type: str,
+    ) -> WebsiteAudit:
+        """Build the audit for a response that is not an HTML page."""
+        def not_html() -> AuditResult:
+            return AuditResult(
+                score=0,
+                findings=[f"Non-HTML response ({content_type})"],
+                recommendations=["Audit a URL that serves an HTML page"],
+                raw_data={"content_type": content_type},
+            )
+        
+        # Only the transport-level security checks still apply
+        return WebsiteAudit(
+            url=url,
+            timestamp=start_time,
+            duration_ms=int((time.time() - start_time) * 1000),
+            title=not_html(),
+            meta_description=not_html(),
+            headings=not_html(),
+            images=not_html(),
+            mobile=not_html(),
+            ssl_security=self._audit_ssl_security(url, response),
+            performance=not_html(),
+            links=not_html(),
+            open_graph=not_html(),
+            schema=not_html(),
+        )
+
+    def audit_many(
+        self, urls: Iterable[str], max_workers: int = 16
+    ) -> Dict[str, Union[WebsiteAudit, Exception]]:
+        """
+        Audit several URLs concurrently.
+        
+        Audits are dominated by network I/O, so they run on a thread pool that
+        shares this auditor's session. A failing URL does not affect the others.
+        
+        Args:
+            urls: The URLs to audit.
+            max_workers: Maximum number of concurrent audits (capped at POOL_SIZE).
+            
+        Returns:
+            Mapping of each URL, in input order, to its WebsiteAudit or to the
+            exception raised while auditing it.
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        
+        results: Dict[str, Union[WebsiteAudit, Exception]] = {}
+        workers = max(1, min(max_workers, self.POOL_SIZE, len(urls)))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.audit, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    results[url] = e
+        
+        return {url: results[url] for url in urls}
 
-    def _audit_title(self, soup: BeautifulSoup) -> AuditResult:
+    def _audit_title(self, tree: LexborHTMLParser) -> AuditResult:
         """Audit the page title."""
         findings = []
         recommendations = []
         
-        title_tag = soup.find("title")
+        title_tag = tree.css_first("title")
         
-        if not title_tag or not title_tag.get_text(strip=True):
+        if not title_tag or not title_tag.text(strip=True):
             findings.append("No title tag found")
             recommendations.append("Add a <title> tag to your <head> section")
             return AuditResult(score=0, findings=findings, recommendations=recommendations)
         
-        title = title_tag.get_text(strip=True)
+        title = title_tag.text(strip=True)
         title_length = len(title)
         
         findings.append(f"Title found: '{title}'")
@@ -203,8 +544,8 @@ class WebsiteAuditor:
             recommendations.append("Shorten your title to 50-60 characters")
         
         # Check for generic titles
-        generic_words = ["home", "untitled", "index", "page", "website"]
-        if any(word in title.lower() for word in generic_words):
+        title_lc = title.lower()
+        if any(word in title_lc for word in _GENERIC_TITLE_WORDS):
             score = max(0, score - 30)
             findings.append("Title appears to be generic")
             recommendations.append("Use a descriptive, unique title that describes your page content")
@@ -216,19 +557,19 @@ class WebsiteAuditor:
             raw_data={"title": title, "length": title_length}
         )
 
-    def _audit_meta_description(self, soup: BeautifulSoup) -> AuditResult:
+    def _audit_meta_description(self, tree: LexborHTMLParser) -> AuditResult:
         """Audit the meta description."""
         findings = []
         recommendations = []
         
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        meta_desc = tree.css_first('meta[name="description"]')
         
         if not meta_desc:
             findings.append("No meta description found")
             recommendations.append("Add a meta description: <meta name='description' content='...'>")
             return AuditResult(score=0, findings=findings, recommendations=recommendations)
         
-        content = meta_desc.get("content", "").strip()
+        content = (meta_desc.attributes.get("content") or "").strip()
         desc_length = len(content)
         
         findings.append(f"Meta description found")
@@ -257,8 +598,8 @@ class WebsiteAuditor:
             recommendations.append("Shorten your description to 150-160 characters")
         
         # Check for generic descriptions
-        generic_phrases = ["this is a website", "welcome to", "click here", "learn more"]
-        if any(phrase in content.lower() for phrase in generic_phrases):
+        content_lc = content.lower()
+        if any(phrase in content_lc for phrase in _GENERIC_DESC_PHRASES):
             score = max(0, score - 20)
             findings.append("Description appears to be generic")
             recommendations.append("Write a compelling, unique description that entices clicks")
@@ -270,31 +611,48 @@ class WebsiteAuditor:
             raw_data={"description": content, "length": desc_length}
         )
 
-    def _audit_headings(self, soup: BeautifulSoup) -> AuditResult:
+    def _audit_headings(self, tree: LexborHTMLParser) -> AuditResult:
         """Audit heading structure (H1-H6)."""
         findings = []
         recommendations = []
         
-        h1_tags = soup.find_all("h1")
-        h2_tags = soup.find_all("h2")
-        h3_tags = soup.find_all("h3")
-        all_headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
+        # Walk all headings once, in document order: count each level, remember
+        # the first H1 and note any skipped levels (e.g. H1 -> H3)
+        counts = [0] * 7
+        first_h1 = None
+        prev_level = 0
+        skipped_levels = []
         
-        findings.append(f"Found {len(h1_tags)} H1, {len(h2_tags)} H2, {len(h3_tags)} H3 tags")
+        all_headings = tree.css("h1, h2, h3, h4, h5, h6")
+        for tag in all_headings:
+            tag_name = tag.tag or ""
+            if tag_name not in ("h1", "h2", "h3", "h4", "h5", "h6"):
+                continue
+            level = int(tag_name[1])
+            counts[level] += 1
+            if level == 1 and first_h1 is None:
+                first_h1 = tag
+            if level > prev_level + 1:
+                skipped_levels.append(f"H{prev_level} -> H{level}")
+            prev_level = level
+        
+        h1_count, h2_count, h3_count = counts[1], counts[2], counts[3]
+        
+        findings.append(f"Found {h1_count} H1, {h2_count} H2, {h3_count} H3 tags")
         
         score = 100
         
         # Check for H1
-        if len(h1_tags) == 0:
+        if first_h1 is None:
             score = max(0, score - 40)
             findings.append("No H1 tag found - every page needs one main heading")
             recommendations.append("Add an H1 tag that describes your main content")
-        elif len(h1_tags) > 1:
+        elif h1_count > 1:
             score = max(0, score - 20)
-            findings.append(f"Multiple H1 tags found ({len(h1_tags)}). Use only one H1 per page.")
+            findings.append(f"Multiple H1 tags found ({h1_count}). Use only one H1 per page.")
             recommendations.append("Consolidate to a single H1 tag")
         else:
-            h1_text = h1_tags[0].get_text(strip=True)
+            h1_text = first_h1.text(strip=True)
             if h1_text:
                 findings.append(f"H1 content: '{h1_text[:50]}...'")
             else:
@@ -303,24 +661,10 @@ class WebsiteAuditor:
                 recommendations.append("Add text content to your H1 tag")
         
         # Check heading hierarchy
-        heading_levels = []
-        for tag in all_headings:
-            level = int(tag.name[1])
-            heading_levels.append(level)
-        
-        if heading_levels:
-            # Check for skipped levels
-            prev_level = 0
-            skipped_levels = []
-            for level in heading_levels:
-                if level > prev_level + 1:
-                    skipped_levels.append(f"H{prev_level} -> H{level}")
-                prev_level = level
-            
-            if skipped_levels:
-                score = max(0, score - 10)
-                findings.append(f"Skipped heading levels detected: {', '.join(skipped_levels[:3])}")
-                recommendations.append("Maintain proper heading hierarchy (don't skip from H1 to H3)")
+        if skipped_levels:
+            score = max(0, score - 10)
+            findings.append(f"Skipped heading levels detected: {', '.join(skipped_levels[:3])}")
+            recommendations.append("Maintain proper heading hierarchy (don't skip from H1 to H3)")
         
         if len(all_headings) == 0:
             score = 0
@@ -332,20 +676,48 @@ class WebsiteAuditor:
             findings=findings,
             recommendations=recommendations,
             raw_data={
-                "h1_count": len(h1_tags),
-                "h2_count": len(h2_tags),
-                "h3_count": len(h3_tags),
+                "h1_count": h1_count,
+                "h2_count": h2_count,
+                "h3_count": h3_count,
                 "total_headings": len(all_headings),
             }
         )
 
-    def _audit_images(self, soup: BeautifulSoup) -> AuditResult:
+    def _collect_image_stats(self, tree: LexborHTMLParser) -> Dict[str, int]:
+        """Count alt text, lazy loading and modern formats over all images in one pass."""
+        total = missing_alt = empty_alt = lazy_loaded = modern_formats = 0
+        
+        for img in tree.css("img"):
+            attrs = img.attributes
+            get = attrs.get
+            total += 1
+            
+            if "alt" not in attrs:
+                missing_alt += 1
+            elif not (attrs["alt"] or "").strip():
+                empty_alt += 1
+            
+            if get("loading") == "lazy":
+                lazy_loaded += 1
+            
+            src = (get("src") or "").lower()
+            if ".webp" in src or ".avif" in src:
+                modern_formats += 1
+        
+        return {
+            "total": total,
+            "missing_alt": missing_alt,
+            "empty_alt": empty_alt,
+            "lazy_loaded": lazy_loaded,
+            "modern_formats": modern_formats,
+        }
+
+    def _audit_images(self, image_stats: Dict[str, int]) -> AuditResult:
         """Audit images for alt tags and optimization."""
         findings = []
         recommendations = []
         
-        images = soup.find_all("img")
-        total_images = len(images)
+        total_images = image_stats["total"]
         
         findings.append(f"Found {total_images} image(s)")
         
@@ -354,16 +726,8 @@ class WebsiteAuditor:
             return AuditResult(score=70, findings=findings, recommendations=recommendations)
         
         # Check for alt tags
-        missing_alt = 0
-        empty_alt = 0
-        
-        for img in images:
-            alt = img.get("alt")
-            if alt is None:
-                missing_alt += 1
-            elif not alt.strip():
-                empty_alt += 1
-        
+        missing_alt = image_stats["missing_alt"]
+        empty_alt = image_stats["empty_alt"]
         with_alt = total_images - missing_alt - empty_alt
         
         findings.append(f"Images with alt text: {with_alt}/{total_images}")
@@ -390,7 +754,7 @@ class WebsiteAuditor:
             recommendations.append(f"Add descriptive alt text to {empty_alt} image(s)")
         
         # Check for lazy loading hints
-        lazy_loaded = sum(1 for img in images if img.get("loading") == "lazy")
+        lazy_loaded = image_stats["lazy_loaded"]
         if lazy_loaded < total_images * 0.5 and total_images > 5:
             recommendations.append("Consider adding loading='lazy' to images below the fold")
         
@@ -407,7 +771,7 @@ class WebsiteAuditor:
             }
         )
 
-    def _audit_mobile(self, soup: BeautifulSoup, response: requests.Response) -> AuditResult:
+    def _audit_mobile(self, tree: LexborHTMLParser, html_content: bytes) -> AuditResult:
         """Audit mobile responsiveness."""
         findings = []
         recommendations = []
@@ -415,14 +779,14 @@ class WebsiteAuditor:
         score = 100
         
         # Check for viewport meta tag
-        viewport = soup.find("meta", attrs={"name": "viewport"})
+        viewport = tree.css_first('meta[name="viewport"]')
         
         if not viewport:
             score = max(0, score - 40)
             findings.append("No viewport meta tag found")
             recommendations.append("Add: <meta name='viewport' content='width=device-width, initial-scale=1'>")
         else:
-            content = viewport.get("content", "")
+            content = viewport.attributes.get("content") or ""
             findings.append(f"Viewport found: {content}")
             
             if "width=device-width" not in content:
@@ -431,15 +795,13 @@ class WebsiteAuditor:
                 recommendations.append("Add width=device-width to viewport content")
         
         # Check for mobile-friendly CSS hints
-        styles = soup.find_all("link", rel="stylesheet")
-        media_queries = len(soup.find_all(string=re.compile(r"@media")))
+        media_queries = html_content.count(b"@media")
         
         if media_queries > 0:
             findings.append(f"Found {media_queries} media query references")
         
         # Check for large fixed widths that break mobile
-        fixed_width_pattern = re.compile(r'width\s*:\s*\d{4,}px', re.IGNORECASE)
-        if fixed_width_pattern.search(response.text):
+        if _FIXED_WIDTH_RE.search(html_content):
             score = max(0, score - 15)
             findings.append("Fixed widths >1000px detected - may cause horizontal scrolling on mobile")
             recommendations.append("Use relative units (%, vw, rem) instead of large fixed pixel widths")
@@ -448,7 +810,7 @@ class WebsiteAuditor:
             score=score,
             findings=findings,
             recommendations=recommendations,
-            raw_data={"viewport": viewport.get("content") if viewport else None}
+            raw_data={"viewport": viewport.attributes.get("content") if viewport else None}
         )
 
     def _audit_ssl_security(self, url: str, response: requests.Response) -> AuditResult:
@@ -470,13 +832,7 @@ class WebsiteAuditor:
         # Check security headers
         headers = response.headers
         
-        security_headers = {
-            "Strict-Transport-Security": "HSTS - forces HTTPS connections",
-            "Content-Security-Policy": "CSP - prevents XSS attacks",
-            "X-Frame-Options": "Prevents clickjacking",
-            "X-Content-Type-Options": "Prevents MIME sniffing",
-            "Referrer-Policy": "Controls referrer information leakage",
-        }
+        security_headers = _SECURITY_HEADERS
         
         found_headers = []
         missing_headers = []
@@ -510,9 +866,11 @@ class WebsiteAuditor:
 
     def _audit_performance(
         self, 
+        tree: LexborHTMLParser,
         response: requests.Response, 
         content_length: int,
-        html_content: str
+        image_stats: Dict[str, int],
+        truncated: bool = False,
     ) -> AuditResult:
         """Audit page performance indicators."""
         findings = []
@@ -536,12 +894,14 @@ class WebsiteAuditor:
             score = max(0, score - 5)
             findings.append("Page is moderately large")
         
-        # Count resources
-        soup = BeautifulSoup(html_content, "html.parser")
+        if truncated:
+            findings.append(f"Only the first {self.MAX_CONTENT_BYTES // (1024 * 1024)} MB were audited")
         
-        css_files = len(soup.find_all("link", rel="stylesheet"))
-        js_files = len(soup.find_all("script", src=True))
-        images = len(soup.find_all("img"))
+        # Count resources
+        stylesheets = tree.css('link[rel~="stylesheet"]')
+        css_files = len(stylesheets)
+        js_files = len(tree.css("script[src]"))
+        images = image_stats["total"]
         
         findings.append(f"External resources: {css_files} CSS, {js_files} JS, {images} images")
         
@@ -557,18 +917,13 @@ class WebsiteAuditor:
             recommendations.append("Consider combining some CSS/JS files")
         
         # Check for render-blocking resources
-        blocking_css = sum(1 for link in soup.find_all("link", rel="stylesheet")
-                          if link.get("media") != "print")
+        blocking_css = sum(1 for link in stylesheets if link.attributes.get("media") != "print")
         
         if blocking_css > 3:
             recommendations.append("Consider loading non-critical CSS asynchronously")
         
         # Check for modern image formats
-        img_srcs = [img.get("src", "") for img in soup.find_all("img")]
-        modern_formats = sum(1 for src in img_srcs if any(ext in src.lower() 
-                           for ext in [".webp", ".avif"]))
-        
-        if images > 0 and modern_formats == 0:
+        if images > 0 and image_stats["modern_formats"] == 0:
             recommendations.append("Consider using WebP format for better compression")
         
         return AuditResult(
@@ -583,12 +938,12 @@ class WebsiteAuditor:
             }
         )
 
-    def _audit_links(self, soup: BeautifulSoup, base_url: str) -> AuditResult:
+    def _audit_links(self, tree: LexborHTMLParser, base_url: str) -> AuditResult:
         """Audit internal and external links."""
         findings = []
         recommendations = []
         
-        links = soup.find_all("a", href=True)
+        links = tree.css("a[href]")
         total_links = len(links)
         
         findings.append(f"Found {total_links} link(s)")
@@ -599,27 +954,31 @@ class WebsiteAuditor:
             return AuditResult(score=30, findings=findings, recommendations=recommendations)
         
         parsed_base = urlparse(base_url)
-        base_domain = parsed_base.netloc
+        base_domain = parsed_base.netloc.lower()
         
         internal = 0
         external = 0
+        external_no_rel = 0
         nofollow = 0
         
         for link in links:
-            href = link.get("href", "")
+            attrs = link.attributes
+            href = attrs.get("href") or ""
+            rel = (attrs.get("rel") or "").split()
             
             # Parse the link
             if href.startswith(("http://", "https://")):
-                parsed_link = urlparse(href)
-                if parsed_link.netloc == base_domain:
+                if _host(href) == base_domain:
                     internal += 1
                 else:
                     external += 1
+                    if "noopener" not in rel:
+                        external_no_rel += 1
             elif not href.startswith(("#", "javascript:", "mailto:", "tel:")):
                 # Relative URL = internal
                 internal += 1
             
-            if link.get("rel") and "nofollow" in link.get("rel", []):
+            if "nofollow" in rel:
                 nofollow += 1
         
         findings.append(f"Internal links: {internal}")
@@ -634,16 +993,10 @@ class WebsiteAuditor:
             recommendations.append("Add more navigation links to improve site structure")
         
         # Check external link attributes
-        if external > 0:
-            external_no_rel = sum(1 for link in links 
-                                 if link.get("href", "").startswith(("http://", "https://"))
-                                 and urlparse(link.get("href")).netloc != base_domain
-                                 and (not link.get("rel") or "noopener" not in link.get("rel", [])))
-            
-            if external_no_rel > 0:
-                score = max(0, score - 10)
-                findings.append(f"{external_no_rel} external links missing rel='noopener noreferrer'")
-                recommendations.append("Add rel='noopener noreferrer' to external links for security")
+        if external_no_rel > 0:
+            score = max(0, score - 10)
+            findings.append(f"{external_no_rel} external links missing rel='noopener noreferrer'")
+            recommendations.append("Add rel='noopener noreferrer' to external links for security")
         
         return AuditResult(
             score=score,
@@ -657,7 +1010,7 @@ class WebsiteAuditor:
             }
         )
 
-    def _audit_open_graph(self, soup: BeautifulSoup) -> AuditResult:
+    def _audit_open_graph(self, tree: LexborHTMLParser) -> AuditResult:
         """Audit Open Graph tags for social sharing."""
         findings = []
         recommendations = []
@@ -671,13 +1024,19 @@ class WebsiteAuditor:
             "og:type": "Content type (website, article, etc.)",
         }
         
+        # Collect every og:* tag in one query; the first occurrence of each wins
+        og_nodes: Dict[str, str] = {}
+        for node in tree.css('meta[property^="og:"]'):
+            attrs = node.attributes
+            og_nodes.setdefault(attrs.get("property") or "", attrs.get("content") or "")
+        
         found_tags = {}
         missing_tags = []
         
         for tag_name, description in og_tags.items():
-            tag = soup.find("meta", property=tag_name)
-            if tag and tag.get("content"):
-                found_tags[tag_name] = tag.get("content")
+            content = og_nodes.get(tag_name)
+            if content:
+                found_tags[tag_name] = content
             else:
                 missing_tags.append((tag_name, description))
         
@@ -692,7 +1051,7 @@ class WebsiteAuditor:
                 recommendations.append(f"Add {tag_name}: {desc}")
         
         # Check for Twitter Cards as bonus
-        twitter_card = soup.find("meta", attrs={"name": "twitter:card"})
+        twitter_card = tree.css_first('meta[name="twitter:card"]')
         if twitter_card:
             findings.append("Twitter Card tags also present ✓")
         else:
@@ -705,13 +1064,13 @@ class WebsiteAuditor:
             raw_data={"found_tags": found_tags, "missing_tags": [t[0] for t in missing_tags]}
         )
 
-    def _audit_schema(self, soup: BeautifulSoup) -> AuditResult:
+    def _audit_schema(self, tree: LexborHTMLParser) -> AuditResult:
         """Audit Schema.org structured data (JSON-LD)."""
         findings = []
         recommendations = []
         
         # Look for JSON-LD script tags
-        jsonld_scripts = soup.find_all("script", type="application/ld+json")
+        jsonld_scripts = tree.css('script[type="application/ld+json"]')
         
         findings.append(f"Found {len(jsonld_scripts)} JSON-LD script(s)")
         
@@ -726,25 +1085,13 @@ class WebsiteAuditor:
         # Check for common schema types
         schema_types_found = []
         for script in jsonld_scripts:
-            try:
-                import json
-                data = json.loads(script.string) if script.string else {}
-                
-                if isinstance(data, dict):
-                    schema_type = data.get("@type", "Unknown")
-                    schema_types_found.append(schema_type)
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            schema_types_found.append(item.get("@type", "Unknown"))
-            except (json.JSONDecodeError, AttributeError):
-                pass
+            schema_types_found.extend(_jsonld_types(script.text()))
         
         if schema_types_found:
-            findings.append(f"Schema types found: {', '.join(schema_types_found[:5])}")
+            findings.append(f"Schema types found: {', '.join(map(_type_label, schema_types_found[:5]))}")
         
         # Check for microdata as bonus
-        microdata = soup.find_all(attrs={"itemscope": True})
+        microdata = tree.css("[itemscope]")
         if microdata:
             findings.append(f"Also found {len(microdata)} microdata element(s)")
         
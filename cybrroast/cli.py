@@ -5,12 +5,22 @@ Handles argument parsing, validation, and orchestrates the audit flow.
 """
 
 import argparse
+import os
+import re
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
 from . import __version__
-from .auditor import WebsiteAuditor
-from .reporter import TerminalReporter, MarkdownReporter, JsonReporter
+
+if TYPE_CHECKING:
+    from .reporter import BaseReporter
+
+# Scheme plus a dotted host, e.g. https://example.com
+_URL_RE = re.compile(r"^https?://[^\s/]+\.[^\s/]+")
+
+# Output file extension -> report format
+_EXT_TO_FORMAT = {".json": "json", ".md": "markdown", ".markdown": "markdown"}
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -86,6 +96,12 @@ Examples:
         help="Save output to file (auto-detects format from extension: .json, .md)",
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Cache audit results in this directory and reuse them while the page is unchanged",
+    )
+
     return parser
 
 
@@ -105,7 +121,7 @@ def validate_url(url: str) -> str:
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
-    if not url.startswith("http") or "." not in url:
+    if not _URL_RE.match(url):
         print(f"Error: Invalid URL '{url}'", file=sys.stderr)
         print("Please provide a valid URL (e.g., https://example.com)", file=sys.stderr)
         sys.exit(1)
@@ -121,28 +137,34 @@ def detect_output_format(output_path: Optional[str]) -> Optional[str]:
         output_path: Path to the output file.
         
     Returns:
-        The detected format ('json', 'md', or None).
+        The detected format ('json', 'markdown', or None).
     """
     if not output_path:
         return None
 
-    output_path = output_path.lower()
-    if output_path.endswith(".json"):
-        return "json"
-    elif output_path.endswith((".md", ".markdown")):
-        return "markdown"
-    return None
+    return _EXT_TO_FORMAT.get(os.path.splitext(output_path)[1].lower())
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
     
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+    
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer --version without building the parser, matching argparse's output
+    if "--version" in argv:
+        print(f"CybrRoast {__version__}")
+        return 0
+
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate URL
     url = validate_url(args.url)
@@ -154,11 +176,15 @@ def main() -> int:
     elif output_format == "markdown":
         args.markdown = True
 
+    # Heavy imports are deferred until a real audit runs, keeping --help fast
+    from .auditor import WebsiteAuditor
+
     # Run the audit
     try:
         auditor = WebsiteAuditor(
             timeout=args.timeout,
             user_agent=args.user_agent,
+            cache_dir=args.cache_dir,
         )
         results = auditor.audit(url)
 
@@ -169,24 +195,31 @@ def main() -> int:
         print(f"\n💥 Audit failed: {e}", file=sys.stderr)
         return 1
 
-    # Generate output
+    # Pick the output format
+    reporter: "BaseReporter"
     if args.json:
-        reporter = JsonReporter(no_roast=args.no_roast, verbose=args.verbose)
-        output = reporter.generate(results)
+        from .reporter import JsonReporter
+        # Saved reports are always indented; stdout's own default applies otherwise
+        reporter = JsonReporter(
+            no_roast=args.no_roast,
+            verbose=args.verbose,
+            pretty=True if args.output else None,
+        )
     elif args.markdown:
+        from .reporter import MarkdownReporter
         reporter = MarkdownReporter(no_roast=args.no_roast, verbose=args.verbose)
-        output = reporter.generate(results)
     else:
+        from .reporter import TerminalReporter
         reporter = TerminalReporter(no_roast=args.no_roast, verbose=args.verbose)
-        output = reporter.generate(results)
 
-    # Write to file or stdout
+    # Write to file or stream straight to stdout
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(output)
+        Path(args.output).write_text(reporter.generate(results), encoding="utf-8")
         print(f"✅ Report saved to: {args.output}")
     else:
-        print(output)
+        reporter.write_to(results, sys.stdout)
+        sys.stdout.write("\n")
+        sys.stdout.flush()
 
     return 0
 
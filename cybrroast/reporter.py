@@ -4,17 +4,55 @@ Output formatters for site-roast.
 Handles terminal, markdown, and JSON output formats.
 """
 
+import bisect
+import io
 import json
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, TextIO
 
-from .auditor import WebsiteAudit, AuditResult
-from .roaster import Roaster
+if TYPE_CHECKING:
+    # Only needed for annotations; importing the auditor pulls in the HTTP stack
+    from .auditor import WebsiteAudit, AuditResult
+    from .roaster import Roaster
+
+
+# (display name, WebsiteAudit attribute) for every audited category, in report order
+_CATEGORIES = (
+    ("Title Tag", "title"),
+    ("Meta Description", "meta_description"),
+    ("Headings", "headings"),
+    ("Images", "images"),
+    ("Mobile", "mobile"),
+    ("SSL/Security", "ssl_security"),
+    ("Performance", "performance"),
+    ("Links", "links"),
+    ("Open Graph", "open_graph"),
+    ("Schema/Structured Data", "schema"),
+)
+
+# Score bands for per-category colours, statuses and mini grades (bisect_right lookups)
+_SCORE_COLOR_THRESHOLDS = (40, 60, 80)
+_SCORE_STATUS_THRESHOLDS = (60, 80)
+_SCORE_STATUSES = ("🔴 Poor", "⚠️ Needs Work", "✅ Good")
+_MINI_GRADE_THRESHOLDS = (65, 75, 85, 93)
+_MINI_GRADES = ("F", "D", "C", "B", "A")
+
+
+@lru_cache(maxsize=2)
+def _get_roaster(no_roast: bool) -> "Roaster":
+    """Return the shared Roaster for the given mode, importing it on first use."""
+    from .roaster import Roaster
+    return Roaster(no_roast=no_roast)
 
 
 class BaseReporter(ABC):
     """Base class for all reporters."""
 
+    __slots__ = ("no_roast", "verbose", "roaster", "_get_roast")
+
     def __init__(self, no_roast: bool = False, verbose: bool = False):
         """
         Initialize the reporter.
@@ -25,11 +63,27 @@ class BaseReporter(ABC):
         """
         self.no_roast = no_roast
         self.verbose = verbose
-        self.roaster = Roaster(no_roast=no_roast)
+        self.roaster = _get_roaster(no_roast)
+        # Serious comments depend only on the score, so they can be memoized;
+        # real roasts are picked at random and must not be
+        self._get_roast = (
+            lru_cache(maxsize=128)(self.roaster.get_roast) if no_roast else self.roaster.get_roast
+        )
 
-    @abstractmethod
-    def generate(self, audit: WebsiteAudit) -> str:
+    def generate(self, audit: "WebsiteAudit") -> str:
         """Generate the report output."""
+        buf = io.StringIO()
+        self.write_to(audit, buf)
+        return buf.getvalue()
+
+    @abstractmethod
+    def write_to(self, audit: "WebsiteAudit", stream: TextIO) -> None:
+        """
+        Write the report output to a text stream, section by section.
+        
+        Implementations start by calling self.roaster.reshuffle(), since the
+        roaster is shared by every report in the process.
+        """
         pass
 
 
@@ -40,6 +94,8 @@ class TerminalReporter(BaseReporter):
     Uses ANSI color codes for a vibrant display.
     """
 
+    __slots__ = ()
+
     # ANSI color codes
     RESET = "\033[0m"
     BOLD = "\033[1m"
@@ -52,11 +108,37 @@ class TerminalReporter(BaseReporter):
     MAGENTA = "\033[95m"
     CYAN = "\033[96m"
     WHITE = "\033[97m"
+    ORANGE = "\033[38;5;208m"
     
     BG_RED = "\033[41m"
     BG_GREEN = "\033[42m"
     BG_YELLOW = "\033[43m"
     BG_BLUE = "\033[44m"
+    
+    _GRADE_COLORS = {
+        "A+": GREEN, "A": GREEN, "A-": GREEN,
+        "B+": CYAN, "B": CYAN, "B-": CYAN,
+        "C+": YELLOW, "C": YELLOW, "C-": YELLOW,
+        "D+": ORANGE, "D": ORANGE, "D-": ORANGE,
+        "F": RED,
+    }
+    _SCORE_COLORS = (RED, ORANGE, YELLOW, GREEN)
+    
+    # Progress bar glyphs
+    _BAR_CHAR = "█"
+    _EMPTY_CHAR = "░"
+    
+    # Pre-rendered banner, assigned from _build_ascii_header() below the class
+    _ASCII_HEADER: str
+    
+    # Pre-colored constant fragments
+    _TRI = f"{CYAN}▶{RESET}"
+    _BULLET = f"{BLUE}•{RESET}"
+    _ARROW = f"{GREEN}→{RESET}"
+    _SPEECH = f"{MAGENTA}💬{RESET}"
+    _BULB = f"{YELLOW}💡{RESET}"
+    _DIVIDER_RED = f"{RED}{'═' * 64}{RESET}"
+    _FINAL_GRADE = f"{WHITE}FINAL GRADE{RESET}"
 
     def _color(self, text: str, color: str) -> str:
         """Apply color to text."""
@@ -64,14 +146,7 @@ class TerminalReporter(BaseReporter):
 
     def _score_color(self, score: int) -> str:
         """Get color based on score."""
-        if score >= 80:
-            return self.GREEN
-        elif score >= 60:
-            return self.YELLOW
-        elif score >= 40:
-            return "\033[38;5;208m"  # Orange
-        else:
-            return self.RED
+        return self._SCORE_COLORS[bisect.bisect_right(_SCORE_COLOR_THRESHOLDS, score)]
 
     def _get_progress_bar(self, score: int, width: int = 20) -> str:
         """Generate a progress bar for the score."""
@@ -79,266 +154,209 @@ class TerminalReporter(BaseReporter):
         empty = width - filled
         
         color = self._score_color(score)
-        bar_char = "█"
-        empty_char = "░"
-        
-        bar = bar_char * filled + empty_char * empty
+        bar = self._BAR_CHAR * filled + self._EMPTY_CHAR * empty
         return f"{color}{bar}{self.RESET}"
 
     def _get_ascii_header(self) -> str:
-        """Generate the ASCII art header."""
-        header = f"""
-{self._color('╔══════════════════════════════════════════════════════════════╗', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('███████╗██╗████████╗███████╗      ██████╗  ██████╗  █████╗ ███████╗████████╗', self.RED)}  {self._color('║', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('██╔════╝██║╚══██╔══╝██╔════╝      ██╔══██╗██╔═══██╗██╔══██╗██╔════╝╚══██╔══╝', self.RED)}  {self._color('║', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('███████╗██║   ██║   ███████╗█████╗██████╔╝██║   ██║███████║███████╗   ██║   ', self.RED)}  {self._color('║', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('╚════██║██║   ██║   ╚════██║╚════╝██╔══██╗██║   ██║██╔══██║╚════██║   ██║   ', self.RED)}  {self._color('║', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('███████║██║   ██║   ███████║      ██║  ██║╚██████╔╝██║  ██║███████║   ██║   ', self.RED)}  {self._color('║', self.RED)}
-{self._color('║', self.RED)}  {self._color('🔥', self.YELLOW)}  {self._color('╚══════╝╚═╝   ╚═╝   ╚══════╝      ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝╚══════╝   ╚═╝   ', self.RED)}  {self._color('║', self.RED)}
-{self._color('╠══════════════════════════════════════════════════════════════╣', self.RED)}
-{self._color('║', self.RED)}     {self._color('Gordon Ramsay meets Web Development', self.YELLOW)}                       {self._color('║', self.RED)}
-{self._color('╚══════════════════════════════════════════════════════════════╝', self.RED)}
-"""
-        return header
+        """Return the ASCII art header."""
+        return self._ASCII_HEADER
 
-    def _format_category(self, name: str, result: AuditResult) -> str:
+    def _format_category(self, name: str, result: "AuditResult") -> str:
         """Format a single category for terminal output."""
-        lines = []
-        
         score_color = self._score_color(result.score)
         progress_bar = self._get_progress_bar(result.score)
         
-        # Category header with score
-        lines.append(f"\n{self.BOLD}{self._color('▶', self.CYAN)} {name}{self.RESET}")
-        lines.append(f"  Score: {self._color(f'{result.score}/100', score_color)} {progress_bar}")
-        
         # Roast comment
-        roast = self.roaster.get_roast(result.score, name)
-        if roast:
-            lines.append(f"  {self._color('💬', self.MAGENTA)} {roast}")
+        roast = self._get_roast(result.score, name)
+        roast_block = f"\n  {self._SPEECH} {roast}" if roast else ""
         
         # Findings
+        findings_block = ""
         if result.findings:
-            lines.append(f"  {self.DIM}Findings:{self.RESET}")
-            for finding in result.findings[:4]:  # Limit to 4 findings
-                lines.append(f"    {self._color('•', self.BLUE)} {finding}")
+            findings_block = f"\n  {self.DIM}Findings:{self.RESET}" + "".join(
+                f"\n    {self._BULLET} {finding}" for finding in result.findings[:4]  # Limit to 4 findings
+            )
         
         # Recommendations (if verbose)
+        recs_block = ""
         if self.verbose and result.recommendations:
-            lines.append(f"  {self._color('💡', self.YELLOW)} Recommendations:")
-            for rec in result.recommendations[:3]:  # Limit to 3 recommendations
-                lines.append(f"    {self._color('→', self.GREEN)} {rec}")
-        
-        return "\n".join(lines)
+            recs_block = f"\n  {self._BULB} Recommendations:" + "".join(
+                f"\n    {self._ARROW} {rec}" for rec in result.recommendations[:3]  # Limit to 3 recommendations
+            )
+        
+        return (
+            f"\n{self.BOLD}{self._TRI} {name}{self.RESET}\n"
+            f"  Score: {self._color(f'{result.score}/100', score_color)} {progress_bar}"
+            f"{roast_block}{findings_block}{recs_block}"
+        )
 
     def _format_grade(self, grade: str, score: int) -> str:
         """Format the overall grade display."""
-        grade_colors = {
-            "A+": self.GREEN, "A": self.GREEN, "A-": self.GREEN,
-            "B+": self.CYAN, "B": self.CYAN, "B-": self.CYAN,
-            "C+": self.YELLOW, "C": self.YELLOW, "C-": self.YELLOW,
-            "D+": "\033[38;5;208m", "D": "\033[38;5;208m", "D-": "\033[38;5;208m",
-            "F": self.RED,
-        }
-        
-        color = grade_colors.get(grade, self.WHITE)
+        color = self._GRADE_COLORS.get(grade, self.WHITE)
         
-        # Big grade display
-        lines = [
-            "",
-            self._color("═" * 64, self.RED),
-            "",
-            f"                    {self.BOLD}{self._color('FINAL GRADE', self.WHITE)}{self.RESET}",
-            "",
-            f"                         {self.BOLD}{self._color(grade, color)}{self.RESET}",
-            f"                       {self._color(f'({score}/100)', self.DIM)}",
-            "",
-        ]
-        
-        # Overall roast
         overall_roast = self.roaster.get_overall_roast(grade, score)
-        lines.append(f"           {self._color(overall_roast, self.CYAN)}")
-        lines.append("")
-        lines.append(self._color("═" * 64, self.RED))
         
-        return "\n".join(lines)
+        # Big grade display
+        return (
+            f"\n{self._DIVIDER_RED}\n\n"
+            f"                    {self.BOLD}{self._FINAL_GRADE}{self.RESET}\n\n"
+            f"                         {self.BOLD}{self._color(grade, color)}{self.RESET}\n"
+            f"                       {self._color(f'({score}/100)', self.DIM)}\n\n"
+            f"           {self._color(overall_roast, self.CYAN)}\n\n"
+            f"{self._DIVIDER_RED}"
+        )
 
-    def generate(self, audit: WebsiteAudit) -> str:
-        """Generate the complete terminal report."""
-        lines = []
+    def write_to(self, audit: "WebsiteAudit", stream: TextIO) -> None:
+        """Write the complete terminal report to a stream."""
+        self.roaster.reshuffle()
+        write = stream.write
         
         # Header
-        lines.append(self._get_ascii_header())
+        write(self._ASCII_HEADER)
         
         # URL info
-        lines.append(f"\n{self.BOLD}Target:{self.RESET} {self._color(audit.url, self.CYAN)}")
-        lines.append(f"{self.DIM}Audit completed in {audit.duration_ms}ms{self.RESET}")
+        write(f"\n\n{self.BOLD}Target:{self.RESET} {self._color(audit.url, self.CYAN)}\n"
+              f"{self.DIM}Audit completed in {audit.duration_ms}ms{self.RESET}")
         
         # Categories
-        categories = [
-            ("Title Tag", audit.title),
-            ("Meta Description", audit.meta_description),
-            ("Headings", audit.headings),
-            ("Images", audit.images),
-            ("Mobile", audit.mobile),
-            ("SSL/Security", audit.ssl_security),
-            ("Performance", audit.performance),
-            ("Links", audit.links),
-            ("Open Graph", audit.open_graph),
-            ("Schema/Structured Data", audit.schema),
-        ]
-        
-        for name, result in categories:
-            lines.append(self._format_category(name, result))
+        for name, attr in _CATEGORIES:
+            write("\n")
+            write(self._format_category(name, getattr(audit, attr)))
         
         # Overall grade
-        lines.append(self._format_grade(audit.get_grade(), audit.get_overall_score()))
+        write("\n")
+        write(self._format_grade(audit.get_grade(), audit.get_overall_score()))
         
         # Footer
-        lines.append(f"\n{self.DIM}Built by Cybrflux — We build what AI can't... yet.{self.RESET}")
-        lines.append(f"{self.DIM}https://github.com/M4ST3R-C0NTR0L{self.RESET}\n")
-        
-        return "\n".join(lines)
+        write(f"\n\n{self.DIM}Built by Cybrflux — We build what AI can't... yet.{self.RESET}\n"
+              f"{self.DIM}https://github.com/M4ST3R-C0NTR0L{self.RESET}\n")
+
+
+def _build_ascii_header() -> str:
+    """Render the ASCII art header; all of its colours are constant."""
+    red, yellow = TerminalReporter.RED, TerminalReporter.YELLOW
+
+    def color(text: str, code: str) -> str:
+        return f"{code}{text}{TerminalReporter.RESET}"
+
+    header = f"""
+{color('╔══════════════════════════════════════════════════════════════╗', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('███████╗██╗████████╗███████╗      ██████╗  ██████╗  █████╗ ███████╗████████╗', red)}  {color('║', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('██╔════╝██║╚══██╔══╝██╔════╝      ██╔══██╗██╔═══██╗██╔══██╗██╔════╝╚══██╔══╝', red)}  {color('║', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('███████╗██║   ██║   ███████╗█████╗██████╔╝██║   ██║███████║███████╗   ██║   ', red)}  {color('║', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('╚════██║██║   ██║   ╚════██║╚════╝██╔══██╗██║   ██║██╔══██║╚════██║   ██║   ', red)}  {color('║', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('███████║██║   ██║   ███████║      ██║  ██║╚██████╔╝██║  ██║███████║   ██║   ', red)}  {color('║', red)}
+{color('║', red)}  {color('🔥', yellow)}  {color('╚══════╝╚═╝   ╚═╝   ╚══════╝      ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝╚══════╝   ╚═╝   ', red)}  {color('║', red)}
+{color('╠══════════════════════════════════════════════════════════════╣', red)}
+{color('║', red)}     {color('Gordon Ramsay meets Web Development', yellow)}                       {color('║', red)}
+{color('╚══════════════════════════════════════════════════════════════╝', red)}
+"""
+    return header
+
+
+TerminalReporter._ASCII_HEADER = _build_ascii_header()
 
 
 class MarkdownReporter(BaseReporter):
     """Generate Markdown report output."""
 
-    def generate(self, audit: WebsiteAudit) -> str:
-        """Generate the complete Markdown report."""
-        lines = []
-        
-        # Header
-        lines.append("# 🔥 Site Roast Report")
-        lines.append("")
-        lines.append(f"**Target:** `{audit.url}`  ")
-        lines.append(f"**Audited:** {self._format_timestamp(audit.timestamp)}  ")
-        lines.append(f"**Duration:** {audit.duration_ms}ms")
-        lines.append("")
-        
-        # Overall grade
+    __slots__ = ()
+
+    _GRADE_EMOJI = {"A": "🌟", "B": "✅", "C": "⚠️", "D": "🔧"}
+
+    def write_to(self, audit: "WebsiteAudit", stream: TextIO) -> None:
+        """Write the complete Markdown report to a stream."""
+        self.roaster.reshuffle()
+        write = stream.write
         grade = audit.get_grade()
         score = audit.get_overall_score()
-        
-        grade_emoji = self._grade_emoji(grade)
-        lines.append(f"## {grade_emoji} Overall Grade: **{grade}** ({score}/100)")
-        lines.append("")
-        
         overall_roast = self.roaster.get_overall_roast(grade, score)
-        lines.append(f"> {overall_roast}")
-        lines.append("")
-        
-        # Summary table
-        lines.append("## 📊 Category Summary")
-        lines.append("")
-        lines.append("| Category | Score | Grade | Status |")
-        lines.append("|----------|-------|-------|--------|")
-        
-        categories = [
-            ("Title Tag", audit.title),
-            ("Meta Description", audit.meta_description),
-            ("Headings", audit.headings),
-            ("Images", audit.images),
-            ("Mobile", audit.mobile),
-            ("SSL/Security", audit.ssl_security),
-            ("Performance", audit.performance),
-            ("Links", audit.links),
-            ("Open Graph", audit.open_graph),
-            ("Schema/Structured Data", audit.schema),
-        ]
         
-        for name, result in categories:
-            status = self._score_status(result.score)
-            mini_grade = self._score_to_mini_grade(result.score)
-            lines.append(f"| {name} | {result.score}/100 | {mini_grade} | {status} |")
+        # Header and overall grade
+        write(f"# 🔥 Site Roast Report\n\n"
+              f"**Target:** `{audit.url}`  \n"
+              f"**Audited:** {self._format_timestamp(audit.timestamp)}  \n"
+              f"**Duration:** {audit.duration_ms}ms\n\n"
+              f"## {self._grade_emoji(grade)} Overall Grade: **{grade}** ({score}/100)\n\n"
+              f"> {overall_roast}\n")
+        
+        # Summary rows and detailed sections come from one pass over the categories
+        summary_rows = []
+        detail_sections = []
+        for name, attr in _CATEGORIES:
+            result = getattr(audit, attr)
+            summary_rows.append(self._summary_row(name, result))
+            detail_sections.append(self._format_category_markdown(name, result))
         
-        lines.append("")
+        # Summary table
+        write("\n## 📊 Category Summary\n\n| Category | Score | Grade | Status |\n|----------|-------|-------|--------|\n")
+        write("\n".join(summary_rows))
         
         # Detailed breakdown
-        lines.append("## 🔍 Detailed Analysis")
-        lines.append("")
-        
-        for name, result in categories:
-            lines.append(self._format_category_markdown(name, result))
+        write("\n\n## 🔍 Detailed Analysis\n\n")
+        write("\n".join(detail_sections))
         
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append("*Generated by [site-roast](https://github.com/M4ST3R-C0NTR0L/site-roast) — Built by [Cybrflux](https://github.com/M4ST3R-C0NTR0L)*")
-        
-        return "\n".join(lines)
+        write("\n---\n\n*Generated by [site-roast](https://github.com/M4ST3R-C0NTR0L/site-roast) — Built by [Cybrflux](https://github.com/M4ST3R-C0NTR0L)*")
 
     def _format_timestamp(self, timestamp: float) -> str:
         """Format timestamp for display."""
-        from datetime import datetime
         return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
     def _grade_emoji(self, grade: str) -> str:
         """Get emoji for grade."""
-        if grade.startswith("A"):
-            return "🌟"
-        elif grade.startswith("B"):
-            return "✅"
-        elif grade.startswith("C"):
-            return "⚠️"
-        elif grade.startswith("D"):
-            return "🔧"
-        else:
-            return "💀"
+        return self._GRADE_EMOJI.get(grade[:1], "💀")
 
     def _score_status(self, score: int) -> str:
         """Get status emoji for score."""
-        if score >= 80:
-            return "✅ Good"
-        elif score >= 60:
-            return "⚠️ Needs Work"
-        else:
-            return "🔴 Poor"
+        return _SCORE_STATUSES[bisect.bisect_right(_SCORE_STATUS_THRESHOLDS, score)]
 
     def _score_to_mini_grade(self, score: int) -> str:
         """Convert score to mini grade."""
-        if score >= 93:
-            return "A"
-        elif score >= 85:
-            return "B"
-        elif score >= 75:
-            return "C"
-        elif score >= 65:
-            return "D"
-        else:
-            return "F"
+        return _MINI_GRADES[bisect.bisect_right(_MINI_GRADE_THRESHOLDS, score)]
+
+    def _summary_row(self, name: str, result: "AuditResult") -> str:
+        """Format a category's row in the summary table."""
+        return f"| {name} | {result.score}/100 | {self._score_to_mini_grade(result.score)} | {self._score_status(result.score)} |"
 
-    def _format_category_markdown(self, name: str, result: AuditResult) -> str:
+    def _format_category_markdown(self, name: str, result: "AuditResult") -> str:
         """Format a single category for Markdown."""
-        lines = []
-        
-        roast = self.roaster.get_roast(result.score, name)
-        
-        lines.append(f"### {name}: {result.score}/100")
-        lines.append("")
-        lines.append(f"*{roast}*")
-        lines.append("")
+        roast = self._get_roast(result.score, name)
+        text = f"### {name}: {result.score}/100\n\n*{roast}*\n"
         
         if result.findings:
-            lines.append("**Findings:**")
-            for finding in result.findings:
-                lines.append(f"- {finding}")
-            lines.append("")
+            text += "\n**Findings:**\n" + "".join(f"- {finding}\n" for finding in result.findings)
         
         if self.verbose and result.recommendations:
-            lines.append("**Recommendations:**")
-            for rec in result.recommendations:
-                lines.append(f"- {rec}")
-            lines.append("")
+            text += "\n**Recommendations:**\n" + "".join(f"- {rec}\n" for rec in result.recommendations)
         
-        return "\n".join(lines)
+        return text
 
 
 class JsonReporter(BaseReporter):
     """Generate JSON report output."""
 
-    def generate(self, audit: WebsiteAudit) -> str:
-        """Generate the complete JSON report."""
+    __slots__ = ("pretty",)
+
+    def __init__(self, no_roast: bool = False, verbose: bool = False, pretty: Optional[bool] = None):
+        """
+        Initialize the reporter.
+        
+        Args:
+            no_roast: If True, disable humorous roasts.
+            verbose: If True, include detailed recommendations.
+            pretty: If True, indent the output. Defaults to indenting only
+                when stdout is a terminal; piped output, or no stdout at all,
+                is compact.
+        """
+        super().__init__(no_roast=no_roast, verbose=verbose)
+        if pretty is None:
+            pretty = sys.stdout is not None and sys.stdout.isatty()
+        self.pretty = pretty
+
+    def write_to(self, audit: "WebsiteAudit", stream: TextIO) -> None:
+        """Write the complete JSON report to a stream."""
+        self.roaster.reshuffle()
         data = {
             "url": audit.url,
             "timestamp": audit.timestamp,
@@ -346,24 +364,20 @@ class JsonReporter(BaseReporter):
             "overall_score": audit.get_overall_score(),
             "grade": audit.get_grade(),
             "categories": {
-                "title": self._category_to_dict("Title Tag", audit.title),
-                "meta_description": self._category_to_dict("Meta Description", audit.meta_description),
-                "headings": self._category_to_dict("Headings", audit.headings),
-                "images": self._category_to_dict("Images", audit.images),
-                "mobile": self._category_to_dict("Mobile", audit.mobile),
-                "ssl_security": self._category_to_dict("SSL/Security", audit.ssl_security),
-                "performance": self._category_to_dict("Performance", audit.performance),
-                "links": self._category_to_dict("Links", audit.links),
-                "open_graph": self._category_to_dict("Open Graph", audit.open_graph),
-                "schema": self._category_to_dict("Schema/Structured Data", audit.schema),
-            }
+                attr: self._category_to_dict(name, getattr(audit, attr))
+                for name, attr in _CATEGORIES
+            },
         }
         
-        return json.dumps(data, indent=2)
+        # One dumps() call keeps the C encoder's single-shot path
+        if self.pretty:
+            stream.write(json.dumps(data, indent=2))
+        else:
+            stream.write(json.dumps(data, separators=(",", ":")))
 
-    def _category_to_dict(self, name: str, result: AuditResult) -> Dict[str, Any]:
+    def _category_to_dict(self, name: str, result: "AuditResult") -> Dict[str, Any]:
         """Convert AuditResult to dictionary."""
-        roast = self.roaster.get_roast(result.score, name) if not self.no_roast else ""
+        roast = "" if self.no_roast else self._get_roast(result.score, name)
         
         data = {
             "name": name,
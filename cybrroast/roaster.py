@@ -4,8 +4,105 @@ Roast generator for site-roast.
 Generates funny, Gordon Ramsay-style commentary based on audit scores.
 """
 
+import bisect
+import itertools
 import random
-from typing import List
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+
+def _interned(strings: Iterable[str]) -> Tuple[str, ...]:
+    """Return the strings as a tuple, interned so repeat comparisons are pointer checks."""
+    return tuple(map(sys.intern, strings))
+
+
+# Lower bounds of the roast buckets above DISASTER_ROASTS (bisect_right lookups)
+_ROAST_THRESHOLDS = (20, 40, 60, 80, 95)
+
+# Serious-mode comments, one per roast bucket
+_SERIOUS_COMMENTS = _interned((
+    "Critical. Immediate attention required for this area.",
+    "Poor. Significant problems affecting this category.",
+    "Below average. Several issues need attention.",
+    "Acceptable. Some issues present but functional.",
+    "Good. Minor improvements could push this to excellent.",
+    "Excellent. This category meets or exceeds best practices.",
+))
+
+
+@lru_cache(maxsize=256)
+def _fmt_overall(grade: str, score: int) -> str:
+    """Format the serious-mode overall summary line."""
+    return sys.intern(f"Overall Score: {score}/100 (Grade: {grade})")
+
+
+# Category-specific context lines by context key and score band
+_CONTEXTS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "title": MappingProxyType({
+        "low": "Your title is so bad, even the browser tab is embarrassed.",
+        "mid": "Title exists but it's as exciting as 'Document1.doc'.",
+    }),
+    "meta_description": MappingProxyType({
+        "low": "No meta description? Google will just make something up. Probably about hamsters.",
+        "mid": "Your meta description is the literary equivalent of elevator music.",
+    }),
+    "headings": MappingProxyType({
+        "low": "Heading structure is a disaster. It's like a book with random chapter numbers.",
+        "mid": "Your headings exist, which is the bare minimum. Congratulations on doing the bare minimum.",
+    }),
+    "images": MappingProxyType({
+        "low": "Images without alt text are just digital decorations for sighted people. Rude.",
+        "mid": "Some images have alt text. The rest are just guessing games for screen readers.",
+    }),
+    "mobile": MappingProxyType({
+        "low": "Not mobile-friendly? What year is this, 2007?",
+        "mid": "Sort of works on mobile. Like how a shoe sort of works as a hammer.",
+    }),
+    "ssl_security": MappingProxyType({
+        "low": "No HTTPS? Your users' data is basically postcards in the mail.",
+        "mid": "You have HTTPS, but your security headers are taking a nap.",
+    }),
+    "performance": MappingProxyType({
+        "low": "This site is so slow, I made coffee while waiting for it to load.",
+        "mid": "Not the fastest, but hey, patience is a virtue, right?",
+    }),
+    "links": MappingProxyType({
+        "low": "Link structure is a maze with no exit. Good luck, users!",
+        "mid": "Links work, but they could be better organized.",
+    }),
+    "open_graph": MappingProxyType({
+        "low": "No Open Graph? Your social shares will look like sad text messages.",
+        "mid": "Basic social tags present. Could use more flair for sharing.",
+    }),
+    "schema": MappingProxyType({
+        "low": "No structured data. Google is playing guessing games with your content.",
+        "mid": "Some schema markup. Enough to get by, not enough to excel.",
+    }),
+})
+
+# Shared fallback for categories without context lines
+_EMPTY_CTX: Mapping[str, str] = MappingProxyType({})
+
+
+# Separators that become underscores in context keys
+_NORM_TABLE = str.maketrans({" ": "_", "/": "_"})
+
+
+@lru_cache(maxsize=64)
+def _norm(category: str) -> str:
+    """Normalize a category name to its context key, e.g. 'SSL/Security' -> 'ssl_security'."""
+    return category.lower().translate(_NORM_TABLE)
+
+
+@lru_cache(maxsize=128)
+def _ctx_for(category_key: str, bucket: int) -> str:
+    """Look up the context line for a category key and score bucket (0 low, 1 mid, 2 none)."""
+    if bucket == 2:
+        return ""
+
+    return _CONTEXTS.get(category_key, _EMPTY_CTX).get("low" if bucket == 0 else "mid", "")
 
 
 class Roaster:
@@ -74,6 +171,18 @@ class Roaster:
         "If websites could feel shame, this one would need therapy.",
     ]
 
+    # Names of the roast pools in _ROAST_THRESHOLDS order, lowest scores first.
+    # The pools are looked up by name when they are shuffled, so edits to the
+    # public lists above are picked up rather than a copy taken at import.
+    _ROAST_POOL_NAMES = (
+        "DISASTER_ROASTS",
+        "BAD_SCORE_ROASTS",
+        "LOW_SCORE_ROASTS",
+        "MID_SCORE_ROASTS",
+        "GOOD_SCORE_ROASTS",
+        "HIGH_SCORE_ROASTS",
+    )
+
     # Overall summary roasts by grade
     GRADE_ROASTS = {
         "A+": [
@@ -138,8 +247,60 @@ class Roaster:
             no_roast: If True, returns serious comments instead of roasts.
         """
         self.no_roast = no_roast
+        # Interned tuples of the public pools, refrozen only when those change
+        self._roast_pools: List[Tuple[str, ...]] = [()] * len(self._ROAST_POOL_NAMES)
+        self._grade_snapshot: Dict[str, Tuple[str, ...]] = {}
+        self._grade_pool: Tuple[str, ...] = ()
+        self._grade_slices: Dict[str, Tuple[int, int]] = {}
+        self.reshuffle()
+
+    def reshuffle(self) -> None:
+        """
+        Start a new report: reread the roast pools and reshuffle them.
+        
+        Reporters call this at the start of every report, so a shared roaster
+        does not replay the same roast order in each report of a batch, and
+        edits to the public pools take effect from the next report.
+
+        Only the per-report state is reset here; each bucket is reread and
+        shuffled the first time the report draws from it.
+        """
+        self._roast_cycles: List[Optional[Iterator[int]]] = [None] * len(self._ROAST_POOL_NAMES)
+        self._grades_stale = True
 
-    def get_roast(self, score: int, category: str = "") -> str:
+    def _shuffle_bucket(self, bucket: int) -> Iterator[int]:
+        """
+        Start a bucket's cycle for the current report.
+
+        The cycle is one shuffled, endless pass over the bucket's indices, so a
+        report never repeats a roast until its bucket is exhausted.
+        """
+        pool = self._freeze_bucket(bucket)
+        cycle = self._roast_cycles[bucket] = itertools.cycle(random.sample(range(len(pool)), len(pool)))
+        return cycle
+
+    def _freeze_bucket(self, bucket: int) -> Tuple[str, ...]:
+        """Return a bucket's pool as an interned tuple, re-interning it only if the public list changed."""
+        pool = tuple(getattr(self, self._ROAST_POOL_NAMES[bucket]))
+        if pool != self._roast_pools[bucket]:
+            self._roast_pools[bucket] = _interned(pool)
+        return self._roast_pools[bucket]
+
+    def _freeze_grades(self) -> None:
+        """Reflatten GRADE_ROASTS into one pool and per-grade (start, stop) slices if it changed."""
+        grades = {grade: tuple(roasts) for grade, roasts in self.GRADE_ROASTS.items()}
+        if grades != self._grade_snapshot:
+            self._grade_snapshot = grades
+            self._grade_pool, self._grade_slices = _flatten_grade_roasts(grades)
+
+    def get_roast(
+        self,
+        score: int,
+        category: str = "",
+        *,
+        _bisect: Callable[[Sequence[int], int], int] = bisect.bisect_right,
+        _thresholds: Tuple[int, ...] = _ROAST_THRESHOLDS,
+    ) -> str:
         """
         Get a roast comment based on score.
         
@@ -153,35 +314,35 @@ class Roaster:
         if self.no_roast:
             return self._get_serious_comment(score)
 
-        if score >= 95:
-            roasts = self.HIGH_SCORE_ROASTS
-        elif score >= 80:
-            roasts = self.GOOD_SCORE_ROASTS
-        elif score >= 60:
-            roasts = self.MID_SCORE_ROASTS
-        elif score >= 40:
-            roasts = self.LOW_SCORE_ROASTS
-        elif score >= 20:
-            roasts = self.BAD_SCORE_ROASTS
-        else:
-            roasts = self.DISASTER_ROASTS
-
-        return random.choice(roasts)
-
-    def _get_serious_comment(self, score: int) -> str:
+        # The keyword-only defaults bind the lookup helpers as fast locals
+        bucket = _bisect(_thresholds, score)
+        cycle = self._roast_cycles[bucket] or self._shuffle_bucket(bucket)
+        return self._roast_pools[bucket][next(cycle)]
+
+    def render_all(self, items: Iterable[Tuple[int, str]]) -> str:
+        """
+        Render roasts for several categories as one newline-separated block.
+        
+        Prefer this to concatenating get_roast() results with += in a loop.
+        
+        Args:
+            items: (score, category) pairs, in output order.
+            
+        Returns:
+            One roast per line.
+        """
+        return "\n".join([self.get_roast(score, category) for score, category in items])
+
+    def _get_serious_comment(
+        self,
+        score: int,
+        *,
+        _bisect: Callable[[Sequence[int], int], int] = bisect.bisect_right,
+        _thresholds: Tuple[int, ...] = _ROAST_THRESHOLDS,
+        _comments: Tuple[str, ...] = _SERIOUS_COMMENTS,
+    ) -> str:
         """Get a serious, professional comment instead of a roast."""
-        if score >= 95:
-            return "Excellent. This category meets or exceeds best practices."
-        elif score >= 80:
-            return "Good. Minor improvements could push this to excellent."
-        elif score >= 60:
-            return "Acceptable. Some issues present but functional."
-        elif score >= 40:
-            return "Below average. Several issues need attention."
-        elif score >= 20:
-            return "Poor. Significant problems affecting this category."
-        else:
-            return "Critical. Immediate attention required for this area."
+        return _comments[_bisect(_thresholds, score)]
 
     def get_overall_roast(self, grade: str, score: int) -> str:
         """
@@ -195,10 +356,13 @@ class Roaster:
             A summary roast string.
         """
         if self.no_roast:
-            return f"Overall Score: {score}/100 (Grade: {grade})"
+            return _fmt_overall(grade, score)
 
-        roasts = self.GRADE_ROASTS.get(grade, self.GRADE_ROASTS["F"])
-        return random.choice(roasts)
+        if self._grades_stale:
+            self._freeze_grades()
+            self._grades_stale = False
+        start, stop = self._grade_slices.get(grade) or self._grade_slices["F"]
+        return self._grade_pool[random.randrange(start, stop)]
 
     def get_category_context(self, category: str, score: int) -> str:
         """
@@ -214,54 +378,17 @@ class Roaster:
         if self.no_roast:
             return ""
 
-        contexts = {
-            "title": {
-                "low": "Your title is so bad, even the browser tab is embarrassed.",
-                "mid": "Title exists but it's as exciting as 'Document1.doc'.",
-            },
-            "meta_description": {
-                "low": "No meta description? Google will just make something up. Probably about hamsters.",
-                "mid": "Your meta description is the literary equivalent of elevator music.",
-            },
-            "headings": {
-                "low": "Heading structure is a disaster. It's like a book with random chapter numbers.",
-                "mid": "Your headings exist, which is the bare minimum. Congratulations on doing the bare minimum.",
-            },
-            "images": {
-                "low": "Images without alt text are just digital decorations for sighted people. Rude.",
-                "mid": "Some images have alt text. The rest are just guessing games for screen readers.",
-            },
-            "mobile": {
-                "low": "Not mobile-friendly? What year is this, 2007?",
-                "mid": "Sort of works on mobile. Like how a shoe sort of works as a hammer.",
-            },
-            "ssl_security": {
-                "low": "No HTTPS? Your users' data is basically postcards in the mail.",
-                "mid": "You have HTTPS, but your security headers are taking a nap.",
-            },
-            "performance": {
-                "low": "This site is so slow, I made coffee while waiting for it to load.",
-                "mid": "Not the fastest, but hey, patience is a virtue, right?",
-            },
-            "links": {
-                "low": "Link structure is a maze with no exit. Good luck, users!",
-                "mid": "Links work, but they could be better organized.",
-            },
-            "open_graph": {
-                "low": "No Open Graph? Your social shares will look like sad text messages.",
-                "mid": "Basic social tags present. Could use more flair for sharing.",
-            },
-            "schema": {
-                "low": "No structured data. Google is playing guessing games with your content.",
-                "mid": "Some schema markup. Enough to get by, not enough to excel.",
-            },
-        }
-
-        category_key = category.lower().replace(" ", "_").replace("/", "_")
-        cat_contexts = contexts.get(category_key, {})
-
-        if score < 40:
-            return cat_contexts.get("low", "")
-        elif score < 70:
-            return cat_contexts.get("mid", "")
-        return ""
+        bucket = 0 if score < 40 else 1 if score < 70 else 2
+        return _ctx_for(_norm(category), bucket)
+
+
+def _flatten_grade_roasts(
+    grade_roasts: Mapping[str, Sequence[str]],
+) -> Tuple[Tuple[str, ...], Dict[str, Tuple[int, int]]]:
+    """Pack per-grade roast lists into one tuple and the (start, stop) slice of each grade."""
+    pool: List[str] = []
+    slices = {}
+    for grade, roasts in grade_roasts.items():
+        slices[grade] = (len(pool), len(pool) + len(roasts))
+        pool.extend(roasts)
+    return _interned(pool), slices
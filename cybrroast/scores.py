@@ -4,7 +4,74 @@ Scoring logic for site-roast.
 Provides utilities for calculating and normalizing scores.
 """
 
-from typing import List, Optional
+import bisect
+import math
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Final, Iterable, Mapping, Optional, Sequence, Tuple
+
+from . import _scalar
+from ._scalar import Number
+
+
+# Lower score bound of each grade above F, and the grades they open (bisect_right lookups)
+_GRADE_THRESHOLDS = (60, 63, 67, 70, 73, 77, 80, 83, 87, 90, 93, 97)
+_GRADES = ("F", "D-", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+_GRADE_DESCRIPTIONS = {
+    "A+": "Exceptional - exceeds all expectations",
+    "A": "Excellent - meets best practices",
+    "A-": "Very Good - minor improvements needed",
+    "B+": "Good - above average",
+    "B": "Above Average - competent work",
+    "B-": "Average Plus - acceptable with room for improvement",
+    "C+": "Slightly Above Average - meets minimum standards",
+    "C": "Average - acceptable but unremarkable",
+    "C-": "Below Average - needs work",
+    "D+": "Poor - significant issues present",
+    "D": "Very Poor - major improvements needed",
+    "D-": "Critical - barely functional",
+    "F": "Failing - requires complete overhaul",
+}
+
+# Grade and description for every score 0-100, indexed by score
+_GRADE_TABLE = tuple(_GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)] for score in range(101))
+_GRADE_DESC_TABLE = tuple(_GRADE_DESCRIPTIONS[grade] for grade in _GRADE_TABLE)
+
+
+def _score_index(score: Number) -> int:
+    """Index of a score in the 0-100 tables; NaN fails every threshold, so it maps to 0."""
+    return int(_scalar.clip(score)) if score == score else 0
+
+
+# Lower bound of each ScoreThresholds bucket above "disaster". These are the one
+# source for both the class constants and the lookup tables below; the tables
+# live at module level, not in the class body, so that they also resolve when
+# this module is compiled with mypyc.
+_EXCELLENT: Final = 90
+_GOOD: Final = 75
+_AVERAGE: Final = 60
+_POOR: Final = 40
+_CRITICAL: Final = 20
+
+# Bucket lower bounds in ascending order and the buckets they open (bisect_right lookups)
+_CATEGORY_THRESHOLDS = (_CRITICAL, _POOR, _AVERAGE, _GOOD, _EXCELLENT)
+_CATEGORY_NAMES = ("disaster", "critical", "poor", "average", "good", "excellent")
+_THRESHOLD_BY_NAME = MappingProxyType(dict(zip(_CATEGORY_NAMES[1:], _CATEGORY_THRESHOLDS)))
+
+# Below this many scores NumPy's conversion overhead outweighs the vectorized sum
+_NUMPY_MIN_SIZE = 64
+
+
+@lru_cache(maxsize=1)
+def _numpy() -> Any:
+    """Import NumPy on first use, or return None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 class ScoreCalculator:
@@ -31,22 +98,15 @@ class ScoreCalculator:
         Returns:
             Normalized score as integer.
         """
-        if max_val == min_val:
-            return target_max
-        
-        normalized = (value - min_val) / (max_val - min_val)
-        normalized = max(0, min(1, normalized))  # Clamp to 0-1
-        
-        score = int(normalized * (target_max - target_min) + target_min)
-        return max(target_min, min(target_max, score))
+        return _scalar.normalize(value, min_val, max_val, target_min, target_max)
 
     @staticmethod
-    def calculate_average(scores: List[int]) -> int:
+    def calculate_average(scores: Sequence[Number]) -> int:
         """
         Calculate the average of multiple scores.
         
         Args:
-            scores: List of scores.
+            scores: List of scores, or a packed array from pack().
             
         Returns:
             Average score rounded to nearest integer.
@@ -56,7 +116,7 @@ class ScoreCalculator:
         return round(sum(scores) / len(scores))
 
     @staticmethod
-    def score_to_grade(score: int) -> str:
+    def score_to_grade(score: Number) -> str:
         """
         Convert a numerical score to a letter grade.
         
@@ -66,32 +126,7 @@ class ScoreCalculator:
         Returns:
             Letter grade (A+ to F).
         """
-        if score >= 97:
-            return "A+"
-        elif score >= 93:
-            return "A"
-        elif score >= 90:
-            return "A-"
-        elif score >= 87:
-            return "B+"
-        elif score >= 83:
-            return "B"
-        elif score >= 80:
-            return "B-"
-        elif score >= 77:
-            return "C+"
-        elif score >= 73:
-            return "C"
-        elif score >= 70:
-            return "C-"
-        elif score >= 67:
-            return "D+"
-        elif score >= 63:
-            return "D"
-        elif score >= 60:
-            return "D-"
-        else:
-            return "F"
+        return _GRADE_TABLE[_score_index(score)]
 
     @staticmethod
     def grade_description(grade: str) -> str:
@@ -104,25 +139,25 @@ class ScoreCalculator:
         Returns:
             Description string.
         """
-        descriptions = {
-            "A+": "Exceptional - exceeds all expectations",
-            "A": "Excellent - meets best practices",
-            "A-": "Very Good - minor improvements needed",
-            "B+": "Good - above average",
-            "B": "Above Average - competent work",
-            "B-": "Average Plus - acceptable with room for improvement",
-            "C+": "Slightly Above Average - meets minimum standards",
-            "C": "Average - acceptable but unremarkable",
-            "C-": "Below Average - needs work",
-            "D+": "Poor - significant issues present",
-            "D": "Very Poor - major improvements needed",
-            "D-": "Critical - barely functional",
-            "F": "Failing - requires complete overhaul",
-        }
-        return descriptions.get(grade, "Unknown")
+        return _GRADE_DESCRIPTIONS.get(grade, "Unknown")
+
+    @staticmethod
+    def score_description(score: Number) -> str:
+        """
+        Get the grade description for a numerical score.
+        
+        Equivalent to grade_description(score_to_grade(score)).
+        
+        Args:
+            score: Score from 0-100.
+            
+        Returns:
+            Description string.
+        """
+        return _GRADE_DESC_TABLE[_score_index(score)]
 
     @staticmethod
-    def penalty(score: int, penalty_amount: int, min_score: int = 0) -> int:
+    def penalty(score: Number, penalty_amount: Number, min_score: Number = 0) -> Number:
         """
         Apply a penalty to a score.
         
@@ -134,10 +169,10 @@ class ScoreCalculator:
         Returns:
             Score after penalty.
         """
-        return max(min_score, score - penalty_amount)
+        return _scalar.penalty(score, penalty_amount, min_score)
 
     @staticmethod
-    def bonus(score: int, bonus_amount: int, max_score: int = 100) -> int:
+    def bonus(score: Number, bonus_amount: Number, max_score: Number = 100) -> Number:
         """
         Apply a bonus to a score.
         
@@ -149,16 +184,16 @@ class ScoreCalculator:
         Returns:
             Score after bonus.
         """
-        return min(max_score, score + bonus_amount)
+        return _scalar.bonus(score, bonus_amount, max_score)
 
     @staticmethod
-    def weighted_average(scores: List[int], weights: List[int]) -> int:
+    def weighted_average(scores: Sequence[Number], weights: Sequence[Number]) -> int:
         """
         Calculate a weighted average of scores.
         
         Args:
-            scores: List of scores.
-            weights: List of weights (must sum to 100 or be normalized).
+            scores: List of scores, or a packed array from pack().
+            weights: List of weights; they need not sum to 100.
             
         Returns:
             Weighted average score.
@@ -169,13 +204,36 @@ class ScoreCalculator:
         if not scores:
             return 0
         
-        # Normalize weights if they don't sum to 100
-        total_weight = sum(weights)
-        if total_weight != 100:
-            weights = [w / total_weight * 100 for w in weights]
+        np = _numpy() if len(scores) >= _NUMPY_MIN_SIZE else None
+        if np is not None:
+            if isinstance(scores, array) and scores.typecode == "B":
+                a = np.frombuffer(scores, dtype=np.uint8)  # zero-copy view of packed scores
+            else:
+                a = np.asarray(scores, dtype=np.float64)
+            w = np.asarray(weights, dtype=np.float64)
+            return round(float(np.dot(a, w)) / float(w.sum()))
         
-        weighted_sum = sum(s * (w / 100) for s, w in zip(scores, weights))
-        return round(weighted_sum)
+        # Dividing by the real total normalizes weights that don't sum to 100
+        return round(math.fsum(s * w for s, w in zip(scores, weights)) / sum(weights))
+
+    @staticmethod
+    def pack(scores: Iterable[int]) -> "array[int]":
+        """
+        Pack scores into a compact array of unsigned bytes.
+        
+        The result uses one byte per score instead of a full int object and
+        can be passed anywhere a list of scores is accepted.
+        
+        Args:
+            scores: Scores from 0-100.
+            
+        Returns:
+            An array('B') of the scores.
+            
+        Raises:
+            OverflowError: If a score does not fit in a byte.
+        """
+        return array("B", scores)
 
 
 class ScoreThresholds:
@@ -183,14 +241,20 @@ class ScoreThresholds:
     Standard thresholds for categorizing scores.
     """
     
-    EXCELLENT = 90
-    GOOD = 75
-    AVERAGE = 60
-    POOR = 40
-    CRITICAL = 20
+    EXCELLENT: Final = _EXCELLENT
+    GOOD: Final = _GOOD
+    AVERAGE: Final = _AVERAGE
+    POOR: Final = _POOR
+    CRITICAL: Final = _CRITICAL
     
-    @classmethod
-    def categorize(cls, score: int) -> str:
+    @staticmethod
+    def categorize(
+        score: Number,
+        *,
+        _bisect: Callable[[Sequence[int], Number], int] = bisect.bisect_right,
+        _thresholds: Tuple[int, ...] = _CATEGORY_THRESHOLDS,
+        _names: Tuple[str, ...] = _CATEGORY_NAMES,
+    ) -> str:
         """
         Categorize a score into a qualitative bucket.
         
@@ -200,21 +264,14 @@ class ScoreThresholds:
         Returns:
             Category string.
         """
-        if score >= cls.EXCELLENT:
-            return "excellent"
-        elif score >= cls.GOOD:
-            return "good"
-        elif score >= cls.AVERAGE:
-            return "average"
-        elif score >= cls.POOR:
-            return "poor"
-        elif score >= cls.CRITICAL:
-            return "critical"
-        else:
-            return "disaster"
+        return _names[_bisect(_thresholds, score)]
     
-    @classmethod
-    def get_threshold(cls, category: str) -> int:
+    @staticmethod
+    def get_threshold(
+        category: str,
+        *,
+        _by_name: Mapping[str, int] = _THRESHOLD_BY_NAME,
+    ) -> int:
         """
         Get the threshold value for a category.
         
@@ -224,11 +281,4 @@ class ScoreThresholds:
         Returns:
             Threshold value.
         """
-        thresholds = {
-            "excellent": cls.EXCELLENT,
-            "good": cls.GOOD,
-            "average": cls.AVERAGE,
-            "poor": cls.POOR,
-            "critical": cls.CRITICAL,
-        }
-        return thresholds.get(category.lower(), 0)
+        return _by_name.get(category.lower(), 0)
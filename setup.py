@@ -1,12 +1,67 @@
+import os
+import sys
+
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
 
 # This setup.py is maintained for backward compatibility.
 # The primary build configuration is in pyproject.toml
 
+
+class OptionalBuildExt(build_ext):
+    """Build native extensions if possible, otherwise keep the pure Python modules."""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as exc:  # No compiler, missing headers, etc.
+            self._warn(exc)
+
+    def build_extension(self, ext):
+        # mypyc's shim modules import its runtime module, so once one
+        # extension fails the rest must not be installed either
+        if getattr(self, "_native_failed", False):
+            return
+        try:
+            super().build_extension(ext)
+        except Exception as exc:
+            self._native_failed = True
+            self._warn(exc)
+
+    @staticmethod
+    def _warn(exc):
+        print(f"warning: native build failed, using pure Python modules ({exc})", file=sys.stderr)
+
+
+def native_extensions():
+    """
+    Compile scores.py with mypyc when CYBRROAST_MYPYC=1 and mypy is installed.
+
+    The pure Python module always ships as well, so a failed or skipped build
+    changes nothing for users.
+    """
+    if os.environ.get("CYBRROAST_MYPYC") != "1":
+        return []
+
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("warning: CYBRROAST_MYPYC=1 but mypyc is not installed", file=sys.stderr)
+        return []
+
+    try:
+        return mypycify(["--follow-imports=silent", "cybrroast/scores.py"])
+    except Exception as exc:  # mypyc rejects the module before any C is emitted
+        OptionalBuildExt._warn(exc)
+        return []
+
+
 setup(
     name="site-roast",
     use_scm_version=True,
     setup_requires=["setuptools_scm"],
     packages=find_packages(),
     python_requires=">=3.8",
+    ext_modules=native_extensions(),
+    cmdclass={"build_ext": OptionalBuildExt},
 )
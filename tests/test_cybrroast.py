@@ -4,13 +4,104 @@ Tests for CybrRoast.
 Run with: pytest
 """
 
+import codecs
+import importlib.util
+import io
+import json
+import os
+import pickle
+import random
+import socket
+import subprocess
+import sys
+import threading
+
 import pytest
-from cybrroast.auditor import AuditResult, WebsiteAuditor
+import requests
+from selectolax.lexbor import LexborHTMLParser
+
+from cybrroast.auditor import (
+    AuditResult, WebsiteAudit, WebsiteAuditor, _decode_html, _host, _jsonld_types,
+)
 from cybrroast.roaster import Roaster
 from cybrroast.reporter import TerminalReporter, MarkdownReporter, JsonReporter
 from cybrroast.scores import ScoreCalculator, ScoreThresholds
 
 
+SAMPLE_HTML = b"""<!DOCTYPE html>
+<html>
+<head>
+  <title>  Sample Page  </title>
+  <meta name="description" content="A short description">
+  <meta property="og:title" content="Sample">
+  <meta property="og:type" content="website">
+  <meta name="twitter:card" content="summary">
+  <link rel="stylesheet" href="/main.css">
+  <style>@media (max-width: 600px) { body { font-size: 14px; } }</style>
+  <script src="/app.js"></script>
+  <script type="application/ld+json">{"@type": "Organization"}</script>
+</head>
+<body>
+  <h1>Main heading</h1>
+  <h3>Skipped a level</h3>
+  <img src="/a.webp" alt="A">
+  <img src="/b.png" alt>
+  <img src="/c.png" loading="lazy">
+  <a href="/about">About</a>
+  <a href="https://example.com/contact">Contact</a>
+  <a href="https://other.org/" rel="nofollow">Other</a>
+  <div itemscope itemtype="https://schema.org/Thing"></div>
+</body>
+</html>
+"""
+
+
+CATEGORY_FIELDS = (
+    "title", "meta_description", "headings", "images", "mobile",
+    "ssl_security", "performance", "links", "open_graph", "schema",
+)
+
+
+def make_audit(*scores):
+    """Build a WebsiteAudit whose categories have the given scores (cycled)."""
+    scores = scores or (80,)
+    results = {
+        name: AuditResult(score=scores[i % len(scores)], findings=[f"{name} finding"],
+                          recommendations=[f"{name} fix"])
+        for i, name in enumerate(CATEGORY_FIELDS)
+    }
+    return WebsiteAudit(url="https://example.com", timestamp=0.0, duration_ms=5, **results)
+
+
+def make_response(body, content_type="text/html; charset=utf-8"):
+    """Build an already-downloaded requests.Response for the given body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+@pytest.fixture
+def tree():
+    return LexborHTMLParser(SAMPLE_HTML)
+
+
+@pytest.fixture(params=["installed", "source"])
+def scores_module(request):
+    """cybrroast.scores as imported (possibly mypyc-compiled), and loaded from its .py source."""
+    import cybrroast.scores
+
+    if request.param == "installed":
+        return cybrroast.scores
+    path = os.path.join(os.path.dirname(cybrroast.scores.__file__), "scores.py")
+    spec = importlib.util.spec_from_file_location("cybrroast._scores_source", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 class TestAuditResult:
     """Tests for AuditResult dataclass."""
 
@@ -26,6 +117,274 @@ class TestAuditResult:
         assert result.findings == []
         assert result.recommendations == []
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_audit_result_slots(self):
+        result = AuditResult(score=50)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.extra = True
+
+
+class TestWebsiteAudit:
+    """Tests for WebsiteAudit scoring."""
+
+    def test_overall_score_and_grade(self):
+        audit = make_audit(90, 100)
+        assert audit.overall_score == 95
+        assert audit.grade == "A"
+        assert audit.get_overall_score() == 95
+        assert audit.get_grade() == "A"
+
+    def test_grade_boundaries(self):
+        for score, grade in [(100, "A+"), (97, "A+"), (96, "A"), (90, "A-"), (89, "B+"),
+                             (80, "B-"), (79, "C+"), (70, "C-"), (60, "D-"), (59, "F"), (0, "F")]:
+            assert make_audit(score).grade == grade
+            assert ScoreCalculator.score_to_grade(score) == grade
+
+    def test_overall_score_is_cached(self):
+        audit = make_audit(50)
+        assert audit.overall_score == 50
+        audit.title.score = 100
+        assert audit.get_overall_score() == 50
+
+
+class TestWebsiteAuditor:
+    """Tests for the WebsiteAuditor category audits (no network access)."""
+
+    def test_audit(self, monkeypatch):
+        auditor = WebsiteAuditor()
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        audit = auditor.audit("https://example.com/")
+        assert audit.title.raw_data["title"] == "Sample Page"
+        assert audit.images.raw_data["total"] == 3
+        assert audit.performance.raw_data["size_kb"] == len(SAMPLE_HTML) / 1024
+
+    def test_audit_decodes_charset(self, monkeypatch):
+        auditor = WebsiteAuditor()
+        page = "<html><head><title>Café Menü</title></head></html>"
+        responses = {
+            "https://example.com/header": make_response(
+                page.encode("latin-1"), content_type="text/html; charset=ISO-8859-1"),
+            "https://example.com/meta": make_response(
+                b'<meta charset="iso-8859-1">' + page.encode("latin-1"), content_type="text/html"),
+            "https://example.com/utf8": make_response(page.encode("utf-8"), content_type="text/html"),
+        }
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: responses[url])
+        for url in responses:
+            assert auditor.audit(url).title.raw_data["title"] == "Café Menü"
+
+    def test_decode_html_undeclared(self):
+        page = "<title>日本語のページタイトルです</title>" * 4
+        assert _decode_html(page.encode("shift_jis"), "text/html") == page
+        assert _decode_html(codecs.BOM_UTF8 + page.encode("utf-8"), "text/html; charset=latin-1") == page
+
+    def test_decode_html_meta_utf16_is_utf8(self):
+        body = b'<meta charset="utf-16"><title>Hello world</title>'
+        assert "<title>Hello world</title>" in _decode_html(body, "text/html")
+        body = b'<meta charset="x-user-defined"><title>caf\xe9</title>'
+        assert "<title>caf\xe9</title>" in _decode_html(body, "text/html")
+
+    def test_audit_cache(self, monkeypatch, tmp_path):
+        auditor = WebsiteAuditor(cache_dir=tmp_path)
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        first = auditor.audit("https://example.com/")
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        monkeypatch.setattr(auditor, "_audit_title", lambda tree: pytest.fail("cache miss"))
+        second = auditor.audit("https://example.com/")
+        assert second.title == first.title
+        assert second.get_overall_score() == first.get_overall_score()
+
+        # A different URL is a different audit even with identical HTML
+        monkeypatch.undo()
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        third = auditor.audit("http://example.com/")
+        assert third.ssl_security.raw_data["https"] is False
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    def test_audit_cache_is_versioned(self, monkeypatch, tmp_path):
+        import cybrroast.auditor
+
+        auditor = WebsiteAuditor(cache_dir=tmp_path)
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        auditor.audit("https://example.com/")
+        monkeypatch.setattr(cybrroast.auditor, "__version__", "0.0.0-other")
+        auditor.audit("https://example.com/")
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    def test_load_cached_treats_incompatible_pickles_as_misses(self, tmp_path):
+        class Stale:
+            def __reduce__(self):
+                return AuditResult, ()  # a constructor signature that has since changed
+
+        path = tmp_path / "stale.pkl"
+        path.write_bytes(pickle.dumps(Stale()))
+        assert WebsiteAuditor(cache_dir=tmp_path)._load_cached(path) is None
+
+    def test_audit_truncates_large_pages(self, monkeypatch):
+        auditor = WebsiteAuditor()
+        monkeypatch.setattr(WebsiteAuditor, "MAX_CONTENT_BYTES", 100)
+        monkeypatch.setattr(WebsiteAuditor, "CHUNK_SIZE", 30)
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        audit = auditor.audit("https://example.com/")
+        assert audit.performance.raw_data["size_kb"] == 100 / 1024
+        assert "Only the first 0 MB were audited" in audit.performance.findings
+
+    def test_audit_body_at_limit_is_not_truncated(self, monkeypatch):
+        auditor = WebsiteAuditor()
+        monkeypatch.setattr(WebsiteAuditor, "MAX_CONTENT_BYTES", len(SAMPLE_HTML))
+        monkeypatch.setattr(WebsiteAuditor, "CHUNK_SIZE", 30)
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: make_response(SAMPLE_HTML))
+        audit = auditor.audit("https://example.com/")
+        assert audit.performance.raw_data["size_kb"] == len(SAMPLE_HTML) / 1024
+        assert not any(f.startswith("Only the first") for f in audit.performance.findings)
+
+    def test_audit_non_html(self, monkeypatch):
+        auditor = WebsiteAuditor()
+        response = make_response(b"%PDF-1.7", content_type="application/pdf")
+        monkeypatch.setattr(auditor.session, "get", lambda url, **kw: response)
+        audit = auditor.audit("https://example.com/file.pdf")
+        assert audit.title.score == 0
+        assert audit.schema.findings == ["Non-HTML response (application/pdf)"]
+        assert audit.ssl_security.raw_data["https"] is True
+
+    def test_session_adapter(self):
+        auditor = WebsiteAuditor()
+        adapter = auditor.session.get_adapter("https://example.com")
+        assert adapter is auditor.session.get_adapter("http://example.com")
+        assert adapter._pool_maxsize == WebsiteAuditor.POOL_SIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header is False
+
+    def test_timeout_is_not_retried(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(8)
+        accepted = []
+
+        def accept():
+            while True:
+                accepted.append(server.accept()[0])
+
+        threading.Thread(target=accept, daemon=True).start()
+        try:
+            with pytest.raises(requests.Timeout):
+                WebsiteAuditor(timeout=0.2).audit(f"http://127.0.0.1:{server.getsockname()[1]}/")
+            assert len(accepted) == 1
+        finally:
+            server.close()
+            for conn in accepted:
+                conn.close()
+
+    def test_audit_many_isolates_failures(self, monkeypatch):
+        auditor = WebsiteAuditor()
+
+        def fake_audit(url):
+            if "bad" in url:
+                raise ValueError(url)
+            return url.upper()
+
+        monkeypatch.setattr(auditor, "audit", fake_audit)
+        results = auditor.audit_many(["https://a.com", "https://bad.com", "https://b.com"])
+        assert list(results) == ["https://a.com", "https://bad.com", "https://b.com"]
+        assert results["https://a.com"] == "HTTPS://A.COM"
+        assert isinstance(results["https://bad.com"], ValueError)
+        assert auditor.audit_many([]) == {}
+
+    def test_audit_title(self, tree):
+        result = WebsiteAuditor()._audit_title(tree)
+        assert result.raw_data["title"] == "Sample Page"
+        assert result.raw_data["length"] == 11
+
+    def test_audit_meta_description(self, tree):
+        result = WebsiteAuditor()._audit_meta_description(tree)
+        assert result.raw_data["description"] == "A short description"
+
+    def test_audit_headings(self, tree):
+        result = WebsiteAuditor()._audit_headings(tree)
+        assert result.raw_data["h1_count"] == 1
+        assert result.raw_data["h3_count"] == 1
+        assert result.raw_data["total_headings"] == 2
+        assert any("H1 -> H3" in finding for finding in result.findings)
+
+    def test_collect_image_stats(self, tree):
+        stats = WebsiteAuditor()._collect_image_stats(tree)
+        assert stats == {
+            "total": 3,
+            "missing_alt": 1,
+            "empty_alt": 1,
+            "lazy_loaded": 1,
+            "modern_formats": 1,
+        }
+
+    def test_audit_images(self, tree):
+        auditor = WebsiteAuditor()
+        result = auditor._audit_images(auditor._collect_image_stats(tree))
+        assert result.raw_data["total"] == 3
+        assert result.raw_data["with_alt"] == 1
+        assert result.raw_data["missing_alt"] == 1
+        assert result.raw_data["empty_alt"] == 1
+        assert result.raw_data["lazy_loaded"] == 1
+
+    def test_audit_mobile(self, tree):
+        result = WebsiteAuditor()._audit_mobile(tree, SAMPLE_HTML)
+        assert result.raw_data["viewport"] is None
+        assert result.score == 60
+        assert "Found 1 media query references" in result.findings
+
+    def test_audit_mobile_fixed_width(self):
+        html = b'<meta name="viewport" content="width=device-width"><div style="width: 1200px">'
+        result = WebsiteAuditor()._audit_mobile(LexborHTMLParser(html), html)
+        assert result.score == 85
+
+    def test_audit_performance(self, tree):
+        auditor = WebsiteAuditor()
+        image_stats = auditor._collect_image_stats(tree)
+        result = auditor._audit_performance(tree, None, len(SAMPLE_HTML), image_stats)
+        assert result.raw_data["css_files"] == 1
+        assert result.raw_data["js_files"] == 1
+        assert result.raw_data["image_count"] == 3
+        assert result.score == 100
+
+    def test_audit_links(self, tree):
+        result = WebsiteAuditor()._audit_links(tree, "https://example.com/")
+        assert result.raw_data["internal"] == 2
+        assert result.raw_data["external"] == 1
+        assert result.raw_data["nofollow"] == 1
+        assert "1 external links missing rel='noopener noreferrer'" in result.findings
+
+    def test_host(self):
+        assert _host("https://Example.com/path") == "example.com"
+        assert _host("http://example.com:8080?q=1") == "example.com:8080"
+        assert _host("https://example.com#top") == "example.com"
+        assert _host("/relative/path") == ""
+
+    def test_jsonld_types(self):
+        assert _jsonld_types('{"@type": "Article"}') == ("Article",)
+        assert _jsonld_types('[{"@type": "A"}, {"name": "x"}, 3]') == ("A", "Unknown")
+        assert _jsonld_types("{not json") == ()
+        assert _jsonld_types("") == ("Unknown",)
+
+    def test_jsonld_array_types_are_frozen(self):
+        assert _jsonld_types('{"@type": ["Organization", "Brand"]}') == (("Organization", "Brand"),)
+        assert _jsonld_types('{"@type": {"bad": 1}}') == ("Unknown",)
+
+        html = '<script type="application/ld+json">{"@type": ["Organization", "Brand"]}</script>'
+        result = WebsiteAuditor()._audit_schema(LexborHTMLParser(html))
+        assert "Schema types found: Organization/Brand" in result.findings
+
+    def test_audit_open_graph(self, tree):
+        result = WebsiteAuditor()._audit_open_graph(tree)
+        assert set(result.raw_data["found_tags"]) == {"og:title", "og:type"}
+        assert result.score == 40
+
+    def test_audit_schema(self, tree):
+        result = WebsiteAuditor()._audit_schema(tree)
+        assert result.raw_data["jsonld_count"] == 1
+        assert result.raw_data["schema_types"] == ["Organization"]
+        assert result.raw_data["microdata_count"] == 1
+
 
 class TestRoaster:
     """Tests for Roaster class."""
@@ -47,12 +406,58 @@ class TestRoaster:
             assert isinstance(roast, str)
             assert len(roast) > 0
 
+    def test_get_roast_does_not_repeat_within_bucket(self):
+        roaster = Roaster()
+        roasts = [roaster.get_roast(5) for _ in Roaster.DISASTER_ROASTS]
+        assert sorted(roasts) == sorted(Roaster.DISASTER_ROASTS)
+
+    def test_get_roast_uses_public_pools(self, monkeypatch):
+        monkeypatch.setattr(Roaster, "HIGH_SCORE_ROASTS", ["custom"])
+        assert Roaster().get_roast(100) == "custom"
+
+    def test_reshuffle_does_no_work_for_untouched_buckets(self, monkeypatch):
+        import cybrroast.roaster as roaster_module
+
+        roaster = Roaster()
+        roaster.get_roast(100)
+        interned, sampled = [], []
+        monkeypatch.setattr(roaster_module, "_interned", lambda pool: interned.append(pool) or tuple(pool))
+        monkeypatch.setattr(random, "sample", lambda pool, k: sampled.append(k) or list(pool))
+        roaster.reshuffle()
+        assert interned == [] and sampled == []
+        roaster.get_roast(100)
+        assert interned == [] and sampled == [len(Roaster.HIGH_SCORE_ROASTS)]
+        monkeypatch.setattr(Roaster, "HIGH_SCORE_ROASTS", ["custom"])
+        roaster.reshuffle()
+        assert roaster.get_roast(100) == "custom"
+        assert interned == [("custom",)]
+
+    def test_get_overall_roast_uses_grade_roasts(self, monkeypatch):
+        monkeypatch.setitem(Roaster.GRADE_ROASTS, "A", ["custom"])
+        roaster = Roaster()
+        assert roaster.get_overall_roast("A", 95) == "custom"
+        assert roaster.get_overall_roast("Z", 0) in Roaster.GRADE_ROASTS["F"]
+
+    def test_render_all(self):
+        roaster = Roaster(no_roast=True)
+        text = roaster.render_all([(100, "Title Tag"), (10, "Images")])
+        assert text.split("\n") == [roaster.get_roast(100), roaster.get_roast(10)]
+        assert roaster.render_all([]) == ""
+
     def test_get_overall_roast(self):
         roaster = Roaster()
         roast = roaster.get_overall_roast("A", 95)
         assert isinstance(roast, str)
         assert len(roast) > 0
 
+    def test_get_category_context(self):
+        roaster = Roaster()
+        assert roaster.get_category_context("SSL/Security", 10).startswith("No HTTPS?")
+        assert roaster.get_category_context("Open Graph", 50).startswith("Basic social tags")
+        assert roaster.get_category_context("Open Graph", 70) == ""
+        assert roaster.get_category_context("Unknown", 10) == ""
+        assert Roaster(no_roast=True).get_category_context("SSL/Security", 10) == ""
+
 
 class TestScoreCalculator:
     """Tests for ScoreCalculator class."""
@@ -63,6 +468,16 @@ class TestScoreCalculator:
         assert calc.normalize_score(75, 0, 100) == 75
         assert calc.normalize_score(0, 0, 100) == 0
         assert calc.normalize_score(100, 0, 100) == 100
+        assert calc.normalize_score(29, 0, 100) == 29
+        assert calc.normalize_score(57.9, 0, 100) == 57
+        assert calc.normalize_score(140, 0, 100) == 100
+        assert calc.normalize_score(5, 0, 10) == 50
+        assert calc.normalize_score(2.9, 0, 10) == 29
+        assert calc.normalize_score(29, 0, 50, 0, 100) == 58
+        assert calc.normalize_score(58, 0, 100, 0, 50) == 29
+        assert calc.normalize_score(-5, 0, 10) == 0
+        assert calc.normalize_score(15, 0, 10) == 100
+        assert calc.normalize_score(3, 10, 0) == 70
 
     def test_calculate_average(self):
         calc = ScoreCalculator()
@@ -78,6 +493,15 @@ class TestScoreCalculator:
         assert calc.score_to_grade(75) == "C"
         assert calc.score_to_grade(65) == "D"
         assert calc.score_to_grade(50) == "F"
+        assert calc.score_to_grade(97) == "A+"
+        assert calc.score_to_grade(96) == "A"
+        assert calc.score_to_grade(-5) == "F"
+        assert calc.score_to_grade(120) == "A+"
+
+    def test_score_description(self):
+        calc = ScoreCalculator()
+        for score in (0, 59, 60, 79, 80, 100):
+            assert calc.score_description(score) == calc.grade_description(calc.score_to_grade(score))
 
     def test_grade_description(self):
         calc = ScoreCalculator()
@@ -85,6 +509,38 @@ class TestScoreCalculator:
         assert isinstance(desc, str)
         assert len(desc) > 0
 
+    def test_jit_kernels(self):
+        pytest.importorskip("numba")
+        code = (
+            "from cybrroast import _scalar; from cybrroast.scores import ScoreCalculator as C; "
+            "print(_scalar.JIT_ENABLED, C.normalize_score(2.5, 0, 10), C.penalty(50, 20, 40), C.bonus(90, 20))"
+        )
+        env = dict(os.environ, CYBRROAST_JIT="1")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert result.stdout.strip() == "True 25 40 100"
+
+    def test_weighted_average(self):
+        calc = ScoreCalculator()
+        assert calc.weighted_average([80, 60], [50, 50]) == 70
+        assert calc.weighted_average([80, 60, 20], [3, 2, 1]) == 63
+        assert calc.weighted_average([], []) == 0
+        with pytest.raises(ValueError):
+            calc.weighted_average([80], [1, 2])
+
+    def test_weighted_average_numpy_path(self):
+        pytest.importorskip("numpy")
+        calc = ScoreCalculator()
+        assert calc.weighted_average([90, 30] * 50, [1, 2] * 50) == 50
+
+    def test_pack(self):
+        calc = ScoreCalculator()
+        packed = calc.pack([80, 90, 100] * 30)
+        assert packed.itemsize == 1
+        assert calc.calculate_average(packed) == 90
+        assert calc.weighted_average(packed, [1] * len(packed)) == 90
+        with pytest.raises(OverflowError):
+            calc.pack([300])
+
     def test_penalty(self):
         calc = ScoreCalculator()
         assert calc.penalty(100, 20) == 80
@@ -96,6 +552,29 @@ class TestScoreCalculator:
         assert calc.bonus(90, 20, max_score=100) == 100
 
 
+    def test_float_scores(self, scores_module):
+        calc = scores_module.ScoreCalculator
+        assert calc.score_to_grade(75.5) == "C"
+        assert calc.score_description(75.5) == calc.grade_description("C")
+        assert calc.penalty(50.5, 10) == 40.5
+        assert calc.bonus(95.5, 10) == 100
+        assert calc.calculate_average([80.5, 60]) == 70
+        assert calc.weighted_average([80.5, 60], [1, 1]) == 70
+        assert scores_module.ScoreThresholds.categorize(72.5) == "average"
+
+    def test_non_finite_scores(self, scores_module):
+        calc = scores_module.ScoreCalculator
+        assert calc.score_to_grade(float("nan")) == "F"
+        assert calc.score_to_grade(float("inf")) == "A+"
+        assert calc.score_to_grade(float("-inf")) == "F"
+        assert calc.score_description(float("inf")) == calc.grade_description("A+")
+
+    def test_int_scores_stay_int(self, scores_module):
+        calc = scores_module.ScoreCalculator
+        assert type(calc.penalty(50, 10)) is int
+        assert type(calc.bonus(50, 10)) is int
+
+
 class TestScoreThresholds:
     """Tests for ScoreThresholds class."""
 
@@ -110,6 +589,14 @@ class TestScoreThresholds:
     def test_get_threshold(self):
         assert ScoreThresholds.get_threshold("excellent") == 90
         assert ScoreThresholds.get_threshold("good") == 75
+        assert ScoreThresholds.get_threshold("CRITICAL") == ScoreThresholds.CRITICAL
+        assert ScoreThresholds.get_threshold("disaster") == 0
+
+    def test_get_threshold_matches_class_constants(self):
+        for name in ("excellent", "good", "average", "poor", "critical"):
+            assert ScoreThresholds.get_threshold(name) == getattr(ScoreThresholds, name.upper())
+            assert ScoreThresholds.categorize(ScoreThresholds.get_threshold(name)) == name
+            assert ScoreThresholds.categorize(ScoreThresholds.get_threshold(name) - 1) != name
 
 
 class TestReporters:
@@ -128,18 +615,89 @@ class TestReporters:
         reporter = JsonReporter(no_roast=False, verbose=True)
         assert reporter.no_roast is False
 
+    @pytest.mark.parametrize("reporter_cls", [TerminalReporter, MarkdownReporter, JsonReporter])
+    def test_reporters_use_slots(self, reporter_cls):
+        assert not hasattr(reporter_cls(), "__dict__")
+
+    def test_reporters_share_roaster(self):
+        assert TerminalReporter().roaster is JsonReporter().roaster
+        assert MarkdownReporter(no_roast=True).roaster is not MarkdownReporter().roaster
+        assert MarkdownReporter(no_roast=True).roaster.no_roast is True
+
+    def test_shared_roaster_reshuffles_per_report(self, monkeypatch):
+        audit = make_audit(5)
+        reporter = MarkdownReporter()
+        random.seed(1)
+        first = reporter.generate(audit)
+        random.seed(1)
+        assert reporter.generate(audit) == first
+
+        monkeypatch.setattr(Roaster, "DISASTER_ROASTS", ["custom"])
+        assert "*custom*" in reporter.generate(audit)
+
+    def test_json_reporter_pretty(self):
+        audit = make_audit(*[80] * 10)
+        compact = JsonReporter(no_roast=True, pretty=False).generate(audit)
+        pretty = JsonReporter(no_roast=True, pretty=True).generate(audit)
+        assert "\n" not in compact and '"score":80' in compact
+        assert pretty.startswith('{\n  "url"')
+        assert json.loads(compact) == json.loads(pretty)
+
+    @pytest.mark.parametrize("reporter_cls", [TerminalReporter, MarkdownReporter, JsonReporter])
+    def test_write_to_matches_generate(self, reporter_cls):
+        audit = make_audit(95, 70, 30, 10)
+        reporter = reporter_cls(no_roast=True, verbose=True)
+        stream = io.StringIO()
+        reporter.write_to(audit, stream)
+        assert stream.getvalue() == reporter.generate(audit)
+
 
 class TestCLI:
     """Tests for CLI functionality."""
 
     def test_validate_url_adds_https(self):
-        from site_roast.cli import validate_url
-        # Mock test - just check function exists
-        assert callable(validate_url)
+        from cybrroast.cli import validate_url
+        assert validate_url("example.com") == "https://example.com"
+        assert validate_url("http://example.com/a") == "http://example.com/a"
+
+    @pytest.mark.parametrize("url", ["localhost", "https://localhost/page.html", "https://exa mple.com"])
+    def test_validate_url_rejects_invalid(self, url):
+        from cybrroast.cli import validate_url
+        with pytest.raises(SystemExit):
+            validate_url(url)
+
+    def test_cli_import_is_lazy(self):
+        code = (
+            "import sys, cybrroast.cli; "
+            "print(any(m in sys.modules for m in ('requests', 'selectolax', 'cybrroast.reporter')))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "False"
+
+    def test_version_skips_parser(self, capsys, monkeypatch):
+        from cybrroast import __version__, cli
+        monkeypatch.setattr(cli, "create_parser", lambda: pytest.fail("parser built"))
+        assert cli.main(["--version"]) == 0
+        assert capsys.readouterr().out == f"CybrRoast {__version__}\n"
+
+    @pytest.mark.parametrize("stdout_isatty", [False, True])
+    def test_json_output_file_is_indented(self, monkeypatch, tmp_path, stdout_isatty):
+        from cybrroast import cli
+
+        monkeypatch.setattr(WebsiteAuditor, "audit", lambda self, url: make_audit(80))
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: stdout_isatty, raising=False)
+        out = tmp_path / "report.json"
+        assert cli.main(["example.com", "--no-roast", "-o", str(out)]) == 0
+        assert out.read_text(encoding="utf-8").startswith('{\n  "url"')
+
+    def test_json_reporter_without_stdout(self, monkeypatch):
+        monkeypatch.setattr(sys, "stdout", None)
+        assert JsonReporter().pretty is False
 
     def test_detect_output_format(self):
-        from site_roast.cli import detect_output_format
+        from cybrroast.cli import detect_output_format
         assert detect_output_format("report.json") == "json"
+        assert detect_output_format("out/REPORT.JSON") == "json"
         assert detect_output_format("report.md") == "markdown"
         assert detect_output_format("report.markdown") == "markdown"
         assert detect_output_format("report.txt") is None